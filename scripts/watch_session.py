@@ -1,6 +1,6 @@
 #!/usr/bin/env -S uv run --no-project
 # /// script
-# dependencies = ["pydantic"]
+# dependencies = ["pydantic", "orjson"]
 # ///
 
 """
@@ -19,6 +19,9 @@ Usage:
     # Watch a specific session (manual mode):
     ./scripts/watch_session.py SESSION_ID [--interval 1.0] [--open-browser]
 
+    # Suppress per-tick streaming status lines:
+    ./scripts/watch_session.py --quiet
+
 Requires:
     - rg (ripgrep) for session discovery
     - uvx (from uv) for running claude-code-log
@@ -30,6 +33,7 @@ import argparse
 import contextlib
 import http.server
 import json
+import mmap
 import os
 import queue
 import shutil
@@ -45,6 +49,7 @@ from html import escape as html_escape
 from pathlib import Path
 from typing import Any
 
+import orjson
 import pydantic
 
 # ==============================================================================
@@ -267,57 +272,57 @@ def _is_process_alive(pid: int) -> bool:
 
 
 class TailState:
-    """Tracks byte offset in a JSONL file for incremental reading."""
+    """Tracks byte offset in a JSONL file for incremental reading.
+
+    New bytes are read through a read-only mmap, so the kernel only pages in
+    the appended region and lines are parsed from memoryview slices without
+    copying them into intermediate bytes objects. A trailing line without a
+    newline is left in the file until the writer completes it; byte_offset
+    always sits on a line boundary.
+    """
 
     def __init__(self, jsonl_path: Path) -> None:
         self.jsonl_path = jsonl_path
         self.byte_offset: int = 0
-        self.partial_line: bytes = b''
 
     def snapshot_end(self) -> None:
         """Set offset to current end of file (after initial render)."""
         self.byte_offset = self.jsonl_path.stat().st_size
-        self.partial_line = b''
 
     def read_new_records(self) -> list[dict[str, Any]]:
         """Read new complete JSONL lines since last offset. Returns parsed dicts."""
         try:
-            size = self.jsonl_path.stat().st_size
+            fd = os.open(self.jsonl_path, os.O_RDONLY)
         except FileNotFoundError:
             return []
 
-        if size <= self.byte_offset and not self.partial_line:
-            return []
-
-        with open(self.jsonl_path, 'rb') as f:
-            f.seek(self.byte_offset)
-            raw = f.read()
+        records: list[dict[str, Any]] = []
+        try:
+            size = os.fstat(fd).st_size
+            if size <= self.byte_offset:
+                return []
 
-        if not raw:
-            return []
+            with mmap.mmap(fd, size, access=mmap.ACCESS_READ) as mm:
+                end = mm.rfind(b'\n', self.byte_offset, size)
+                if end == -1:
+                    return []  # Only a partial line so far
 
-        # Prepend any buffered partial line from previous read
-        if self.partial_line:
-            raw = self.partial_line + raw
-            self.partial_line = b''
+                view = memoryview(mm)
+                try:
+                    pos = self.byte_offset
+                    while pos <= end:
+                        nl = mm.find(b'\n', pos, end + 1)
+                        if nl > pos:
+                            with contextlib.suppress(orjson.JSONDecodeError):
+                                records.append(orjson.loads(view[pos:nl]))
+                        pos = nl + 1
+                finally:
+                    view.release()
+
+                self.byte_offset = end + 1
+        finally:
+            os.close(fd)
 
-        # Split into lines; buffer incomplete trailing line
-        parts = raw.split(b'\n')
-        if raw.endswith(b'\n'):
-            complete_lines = parts[:-1]  # last element is empty string after final \n
-            self.byte_offset += len(raw)
-        else:
-            complete_lines = parts[:-1]
-            self.partial_line = parts[-1]
-            self.byte_offset += len(raw) - len(self.partial_line)
-
-        records = []
-        for line_bytes in complete_lines:
-            line = line_bytes.strip()
-            if not line:
-                continue
-            with contextlib.suppress(json.JSONDecodeError):
-                records.append(json.loads(line))
         return records
 
 
@@ -584,14 +589,25 @@ def render_record(record: dict[str, Any], counter: list[int]) -> list[str]:
 # ==============================================================================
 
 
+def _sse_message(html: str, event_id: str = '') -> bytes:
+    """Render an HTML fragment as a complete SSE message frame."""
+    payload = b'data: ' + orjson.dumps(html) + b'\n'
+    if event_id:
+        payload += b'id: ' + event_id.encode() + b'\n'
+    return payload + b'\n'
+
+
 def broadcast_sse(server: http.server.HTTPServer, html: str, event_id: str = '') -> None:
-    """Push an HTML fragment to all connected SSE clients."""
-    encoded = json.dumps(html)
+    """Push an HTML fragment to all connected SSE clients.
+
+    The frame is serialized once; every client queue shares the same bytes.
+    """
+    payload = _sse_message(html, event_id)
     with server.sse_lock:  # type: ignore[attr-defined]
-        dead: list[queue.Queue] = []  # type: ignore[type-arg]
+        dead: list[queue.Queue[bytes]] = []
         for q in server.sse_clients:  # type: ignore[attr-defined]
             try:
-                q.put_nowait((encoded, event_id))
+                q.put_nowait(payload)
             except queue.Full:
                 dead.append(q)
         for q in dead:
@@ -600,10 +616,11 @@ def broadcast_sse(server: http.server.HTTPServer, html: str, event_id: str = '')
 
 def broadcast_event(server: http.server.HTTPServer, event: str, data: str = '') -> None:
     """Push a named SSE event to all connected clients."""
+    payload = f'event: {event}\ndata: {data}\n\n'.encode()
     with server.sse_lock:  # type: ignore[attr-defined]
         for q in server.sse_clients:  # type: ignore[attr-defined]
             with contextlib.suppress(queue.Full):
-                q.put_nowait(('__event__', f'event: {event}\ndata: {data}\n\n'))
+                q.put_nowait(payload)
 
 
 # ==============================================================================
@@ -622,6 +639,11 @@ class _WatchHandler(http.server.SimpleHTTPRequestHandler):
         with contextlib.suppress(BrokenPipeError, ConnectionResetError, OSError):
             super().finish()
 
+    def copyfile(self, source: Any, outputfile: Any) -> None:
+        """Send static files with socket.sendfile (zero-copy sendfile(2) where supported)."""
+        outputfile.flush()
+        self.connection.sendfile(source)
+
     def do_GET(self) -> None:
         if self.path == '/events' or self.path.startswith('/events?'):
             self._handle_sse()
@@ -648,23 +670,15 @@ class _WatchHandler(http.server.SimpleHTTPRequestHandler):
             # Replay records from that byte offset
             self._replay_from_offset(last_id)
 
-        client_queue: queue.Queue[tuple[str, str]] = queue.Queue(maxsize=1000)
+        client_queue: queue.Queue[bytes] = queue.Queue(maxsize=1000)
         with self.server.sse_lock:  # type: ignore[attr-defined]
             self.server.sse_clients.append(client_queue)  # type: ignore[attr-defined]
 
         try:
             while True:
                 try:
-                    encoded, event_id = client_queue.get(timeout=15)
-                    if encoded == '__event__':
-                        # Named event - event_id contains the full formatted event
-                        self.wfile.write(event_id.encode())
-                    else:
-                        msg = f'data: {encoded}\n'
-                        if event_id:
-                            msg += f'id: {event_id}\n'
-                        msg += '\n'
-                        self.wfile.write(msg.encode())
+                    # Frames are pre-rendered by broadcast_sse/broadcast_event
+                    self.wfile.write(client_queue.get(timeout=15))
                     self.wfile.flush()
                 except queue.Empty:
                     # Heartbeat
@@ -708,13 +722,12 @@ class _WatchHandler(http.server.SimpleHTTPRequestHandler):
                 current_offset += len(line_bytes) + 1
                 continue
             try:
-                record = json.loads(line_bytes)
+                record = orjson.loads(line_bytes)
                 fragments = render_record(record, counter)
+                eid = str(current_offset + len(line_bytes) + 1)
                 for html_frag in fragments:
-                    encoded = json.dumps(html_frag)
-                    eid = str(current_offset + len(line_bytes) + 1)
-                    self.wfile.write(f'data: {encoded}\nid: {eid}\n\n'.encode())
-            except json.JSONDecodeError:
+                    self.wfile.write(_sse_message(html_frag, eid))
+            except orjson.JSONDecodeError:
                 pass
             current_offset += len(line_bytes) + 1
 
@@ -883,11 +896,16 @@ def regenerate(jsonl_path: Path, html_path: Path) -> float:
         shutil.copy2(jsonl_path, tmp_jsonl)
 
         start = time.monotonic()
-        result = subprocess.run(
-            ['uvx', 'claude-code-log@latest', str(tmp_jsonl)],
-            capture_output=True,
-            text=True,
-        )
+        try:
+            result = subprocess.run(
+                ['uvx', 'claude-code-log@latest', str(tmp_jsonl)],
+                capture_output=True,
+                text=True,
+            )
+        except FileNotFoundError:
+            # Checked here rather than up front so startup skips the PATH walk
+            print(f'{Colors.RED}Error:{Colors.RESET} uvx not found on PATH (install uv)')
+            sys.exit(1)
         elapsed = time.monotonic() - start
 
         if result.returncode != 0:
@@ -914,8 +932,14 @@ def watch(
     open_browser: bool,
     *,
     daemon: DaemonContext | None = None,
+    quiet: bool = False,
 ) -> None:
-    """Watch JSONL and stream new records via SSE."""
+    """Watch JSONL and stream new records via SSE.
+
+    With quiet=True, per-tick "Streamed/Drained N block(s)" status lines are
+    skipped entirely (no formatting, no stdout writes).
+    """
+    log_enabled = not quiet
     html_path = jsonl_path.with_suffix('.html')
     session_id = jsonl_path.stem
     msg_counter = [0]
@@ -924,18 +948,23 @@ def watch(
     server, port = start_http_server(html_path.parent, jsonl_path, msg_counter)
     url = f'http://127.0.0.1:{port}/{html_path.name}'
 
-    print(f'{Colors.BOLD}{"=" * 60}{Colors.RESET}')
-    print(f'{Colors.BOLD}Claude Code Session Watcher (SSE){Colors.RESET}')
-    print(f'{Colors.BOLD}{"=" * 60}{Colors.RESET}')
-    print()
-    print(f'  {Colors.CYAN}Session:{Colors.RESET}  {session_id}')
-    print(f'  {Colors.CYAN}File:{Colors.RESET}     {jsonl_path}')
-    print(f'  {Colors.CYAN}Serving:{Colors.RESET}  {url}')
-    print(f'  {Colors.CYAN}Polling:{Colors.RESET}  every {interval}s')
+    rule = f'{Colors.BOLD}{"=" * 60}{Colors.RESET}'
+    banner = [
+        rule,
+        f'{Colors.BOLD}Claude Code Session Watcher (SSE){Colors.RESET}',
+        rule,
+        '',
+        f'  {Colors.CYAN}Session:{Colors.RESET}  {session_id}',
+        f'  {Colors.CYAN}File:{Colors.RESET}     {jsonl_path}',
+        f'  {Colors.CYAN}Serving:{Colors.RESET}  {url}',
+        f'  {Colors.CYAN}Polling:{Colors.RESET}  every {interval}s',
+    ]
     if daemon is not None:
-        print(f'  {Colors.CYAN}Mode:{Colors.RESET}    daemon (auto-close when session ends)')
-        print(f'  {Colors.CYAN}Claude:{Colors.RESET}  PID {daemon.claude_pid}')
-    print()
+        banner.append(f'  {Colors.CYAN}Mode:{Colors.RESET}    daemon (auto-close when session ends)')
+        banner.append(f'  {Colors.CYAN}Claude:{Colors.RESET}  PID {daemon.claude_pid}')
+    banner.append('')
+    sys.stdout.write('\n'.join(banner) + '\n')
+    sys.stdout.flush()
 
     # Initial full generation
     ts = time.strftime('%H:%M:%S')
@@ -963,10 +992,10 @@ def watch(
 
     while True:
         time.sleep(interval)
+        ts = time.strftime('%H:%M:%S')
 
         # Check for session closure (daemon mode)
         if daemon is not None and not _is_process_alive(daemon.claude_pid):
-            ts = time.strftime('%H:%M:%S')
             print(
                 f'{Colors.DIM}[{ts}]{Colors.RESET} {Colors.YELLOW}Session ended, draining final records...{Colors.RESET}'
             )
@@ -976,7 +1005,7 @@ def watch(
                 for html_frag in render_record(record, msg_counter):
                     broadcast_sse(server, html_frag, str(tail.byte_offset))
                     rendered_count += 1
-            if rendered_count:
+            if rendered_count and log_enabled:
                 print(
                     f'{Colors.DIM}[{ts}]{Colors.RESET} Drained {rendered_count} block(s) '
                     f'from {len(final_records)} record(s)'
@@ -989,7 +1018,6 @@ def watch(
         # Check for full refresh request
         if server.refresh_flag.is_set():  # type: ignore[attr-defined]
             server.refresh_flag.clear()  # type: ignore[attr-defined]
-            ts = time.strftime('%H:%M:%S')
             print(f'{Colors.DIM}[{ts}]{Colors.RESET} Full refresh requested...', flush=True)
             elapsed = regenerate(jsonl_path, html_path)
             tail.snapshot_end()
@@ -1007,7 +1035,6 @@ def watch(
 
         # Check for file truncation
         if file_size < tail.byte_offset:
-            ts = time.strftime('%H:%M:%S')
             print(f'{Colors.DIM}[{ts}]{Colors.RESET} {Colors.YELLOW}File truncated — full refresh{Colors.RESET}')
             elapsed = regenerate(jsonl_path, html_path)
             tail.snapshot_end()
@@ -1020,7 +1047,6 @@ def watch(
         if not new_records:
             continue
 
-        ts = time.strftime('%H:%M:%S')
         rendered_count = 0
 
         for record in new_records:
@@ -1029,7 +1055,7 @@ def watch(
                 broadcast_sse(server, html_frag, str(tail.byte_offset))
                 rendered_count += 1
 
-        if rendered_count:
+        if rendered_count and log_enabled:
             print(
                 f'{Colors.DIM}[{ts}]{Colors.RESET} Streamed {rendered_count} block(s) from {len(new_records)} record(s)'
             )
@@ -1055,13 +1081,10 @@ def main() -> None:
     parser.add_argument(
         '--no-auto-close', action='store_true', help='Disable auto-exit when session ends (daemon mode)'
     )
+    parser.add_argument('--quiet', '-q', action='store_true', help='Suppress per-tick streaming status lines')
 
     args = parser.parse_args()
 
-    if not shutil.which('uvx'):
-        print(f'{Colors.RED}Error:{Colors.RESET} uvx not found on PATH (install uv)')
-        sys.exit(1)
-
     daemon: DaemonContext | None = None
 
     if args.session is not None:
@@ -1079,7 +1102,7 @@ def main() -> None:
         daemon = None if args.no_auto_close else ctx
         open_browser = not args.no_browser  # Default ON in daemon mode
 
-    watch(jsonl_path, args.interval, open_browser, daemon=daemon)
+    watch(jsonl_path, args.interval, open_browser, daemon=daemon, quiet=args.quiet)
 
 
 if __name__ == '__main__':
@@ -6,32 +6,66 @@ Provides a simple logger that outputs to stdout/stderr for CLI commands.
 
 from __future__ import annotations
 
+import json
+import sys
+from collections.abc import Callable
+
+
+def _discard(message: str) -> None:
+    """No-op sink for info messages when not verbose."""
+
 
 class CLILogger:
     """
     Logger implementation for CLI (implements LoggerProtocol from services).
 
-    Outputs messages to stdout/stderr with optional verbose mode.
+    Outputs info messages to stdout and warnings/errors to stderr, each as a
+    single pre-formatted write, with optional verbose mode. In json_lines mode
+    each message is a compact {"level": ..., "message": ...} JSON object.
     """
 
-    def __init__(self, verbose: bool = False) -> None:
+    info_sync: Callable[[str], None]
+
+    def __init__(self, verbose: bool = False, json_lines: bool = False) -> None:
         """
         Initialize CLI logger.
 
         Args:
             verbose: If True, show info messages. If False, only warnings/errors.
+            json_lines: If True, emit one JSON object per message instead of '[LEVEL] message'.
         """
         self.verbose = verbose
+        self.json_lines = json_lines
+        # Bound once: non-verbose info calls hit a no-op instead of re-checking verbose
+        self.info_sync = self._write_info if verbose else _discard
+
+    def _format(self, level: str, message: str) -> str:
+        if self.json_lines:
+            # stdlib json: one tiny object per message isn't worth loading orjson at CLI startup
+            return json.dumps({'level': level, 'message': message}, ensure_ascii=False, separators=(',', ':')) + '\n'
+        return f'[{level.upper()}] {message}\n'
+
+    def _write_info(self, message: str) -> None:
+        sys.stdout.write(self._format('info', message))
+
+    def warning_sync(self, message: str) -> None:
+        """Log warning message without going through a coroutine."""
+        sys.stderr.write(self._format('warning', message))
+
+    def error_sync(self, message: str) -> None:
+        """Log error message without going through a coroutine."""
+        sys.stderr.write(self._format('error', message))
+
+    # LoggerProtocol shims for services (CLI code calls the *_sync methods directly)
 
     async def info(self, message: str) -> None:
         """Log info message (only if verbose)."""
-        if self.verbose:
-            print(f'[INFO] {message}')
+        self.info_sync(message)
 
     async def warning(self, message: str) -> None:
         """Log warning message."""
-        print(f'[WARNING] {message}')
+        self.warning_sync(message)
 
     async def error(self, message: str) -> None:
         """Log error message."""
-        print(f'[ERROR] {message}')
+        self.error_sync(message)
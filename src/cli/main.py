@@ -7,37 +7,30 @@ Provides commands to archive and restore Claude Code sessions.
 
 from __future__ import annotations
 
-import asyncio
+import functools
 import os
 import re
+import shutil
 import subprocess
+import sys
 import tempfile
+import time
 import traceback
-from collections.abc import Sequence
-from datetime import UTC, datetime
+from collections.abc import Coroutine, Sequence
 from pathlib import Path
-from typing import Literal, TypeGuard
+from typing import TYPE_CHECKING, Any, Literal, TypeGuard, get_args
 
-import httpx
 import typer
 
 from src.cli.logger import CLILogger
 from src.exceptions import ClaudeSessionError
 from src.launcher import launch_claude_with_session
 from src.paths import encode_path
-from src.schemas.operations.lineage import LineageTree
-from src.services.archive import SessionArchiveService
-from src.services.claude_process import auto_detect_session_id
-from src.services.clone import SessionCloneService
-from src.services.delete import SessionDeleteService
-from src.services.discovery import SessionDiscoveryService
-from src.services.info import SessionInfoService
-from src.services.lineage import LineageService
-from src.services.move import SessionMoveService
-from src.services.parser import SessionParserService
-from src.services.restore import SessionRestoreService
-from src.storage.gist import GistStorage
-from src.storage.local import LocalFileSystemStorage
+
+# Service, storage and httpx imports are deferred into the commands that use them,
+# so `claude-session --help` and each subcommand only load what they need.
+if TYPE_CHECKING:
+    from src.schemas.operations.lineage import LineageTree
 
 app = typer.Typer(
     name='claude-session',
@@ -45,13 +38,70 @@ app = typer.Typer(
     add_completion=False,
 )
 
+# ANSI colors for batched stdout output, resolved once at import
+_USE_COLOR = sys.stdout.isatty() and 'NO_COLOR' not in os.environ
+_BOLD = '\x1b[1m'
+_RED = '\x1b[31m'
+_GREEN = '\x1b[32m'
+_CYAN = '\x1b[36m'
+_YELLOW = '\x1b[33m'
+_RESET = '\x1b[0m'
+
+# How to supply a GitHub token, shown when archiving to a gist without one
+_GIST_TOKEN_HELP = (
+    'Provide via one of:\n'
+    '  1. gh auth login (GitHub CLI - recommended)\n'
+    '  2. Set GITHUB_TOKEN environment variable\n'
+    '  3. Pass --gist-token flag\n'
+    '\n'
+    'To create a token manually:\n'
+    '  1. Go to https://github.com/settings/tokens\n'
+    '  2. Generate new token (classic)\n'
+    "  3. Select 'gist' scope\n"
+    '  4. Copy the token'
+)
+
+# URL scheme selecting GitHub Gist storage (gist://<gist-id>)
+_GIST_PREFIX = 'gist://'
+
+# Archive filenames recognized in a gist (.b64 variants hold binary archives)
+_GIST_ARCHIVE_SUFFIXES = ('.json', '.json.zst', '.json.b64', '.json.zst.b64')
+
+
+def _color(text: str, code: str) -> str:
+    """Wrap text in an ANSI color code when stdout is a color-capable TTY."""
+    return f'{code}{text}{_RESET}' if _USE_COLOR else text
+
+
+def _report_error(logger: CLILogger, message: str, *details: str) -> None:
+    """Report an error on stderr: red text and detail lines, or one JSON line with --json."""
+    if logger.json_lines:
+        logger.error_sync('\n'.join((message, *details)))
+        return
+    typer.secho(f'Error: {message}', fg=typer.colors.RED, err=True)
+    for detail in details:
+        typer.echo(detail, err=True)
+
+
 # Type aliases and validators
 ArchiveFormat = Literal['json', 'zst']
+_ARCHIVE_FORMATS: frozenset[str] = frozenset(get_args(ArchiveFormat))
+
+
+def _run[T](coro: Coroutine[Any, Any, T]) -> T:
+    """Run a command's async implementation.
+
+    asyncio is imported here rather than at module top: it is the single largest
+    import in the CLI and isn't needed for --help or argument errors.
+    """
+    import asyncio
+
+    return asyncio.run(coro)
 
 
 def _is_archive_format(value: str) -> TypeGuard[ArchiveFormat]:
     """Type guard for valid archive formats."""
-    return value in ('json', 'zst')
+    return value in _ARCHIVE_FORMATS
 
 
 def _validate_archive_format(value: str | None) -> ArchiveFormat | None:
@@ -63,11 +113,46 @@ def _validate_archive_format(value: str | None) -> ArchiveFormat | None:
     raise typer.BadParameter("Must be 'json' or 'zst'")
 
 
+def _resolve_project(value: Path | None) -> Path | None:
+    """Typer callback for --project: resolve once at parse time and require it to exist."""
+    if value is None:
+        return None
+    resolved = value.resolve()
+    if not os.path.exists(resolved):
+        raise typer.BadParameter(f'Project directory does not exist: {resolved}')
+    return resolved
+
+
+def _fast_resolve(path: Path) -> Path:
+    """Return path as-is if already absolute and free of '..', else resolve() it.
+
+    Skips the realpath() syscall walk for the common absolute-path case. Only for
+    paths where symlink resolution doesn't matter (not project paths, whose
+    resolved form determines the encoded ~/.claude/projects directory).
+    """
+    if path.is_absolute() and '..' not in path.parts:
+        return path
+    return path.resolve()
+
+
+@functools.cache
+def _auto_detect_session_id() -> str | None:
+    """Detect the current Claude Code session once per process.
+
+    clone and move check for an enclosing session before calling
+    _resolve_session_id; memoizing avoids a second process tree walk.
+    """
+    from src.services.claude_process import auto_detect_session_id
+
+    return auto_detect_session_id()
+
+
 def _resolve_session_id(session_id: str | None) -> str:
     """Resolve session_id, auto-detecting from Claude Code if not provided."""
     if session_id is not None:
         return session_id
-    detected = auto_detect_session_id()
+
+    detected = _auto_detect_session_id()
     if detected is None:
         typer.secho('Error: Not running inside Claude Code.', fg=typer.colors.RED, err=True)
         typer.echo('Provide a session ID: claude-session <command> <session-id>', err=True)
@@ -121,6 +206,7 @@ def archive(
     ),
     gist_description: str = typer.Option('Claude Code Session Archive', '--gist-description', help='Gist description'),
     verbose: bool = typer.Option(False, '--verbose', '-v', help='Verbose output'),
+    json_output: bool = typer.Option(False, '--json', help='Emit progress and the result as JSON lines'),
 ) -> None:
     """Archive a Claude Code session to local file or GitHub Gist.
 
@@ -145,10 +231,12 @@ def archive(
 
     # Default output to gist://
     if output is None:
-        output = 'gist://'
+        output = _GIST_PREFIX
 
-    asyncio.run(
-        _archive_async(resolved_session_id, output, format, gist_token, gist_visibility, gist_description, verbose)
+    _run(
+        _archive_async(
+            resolved_session_id, output, format, gist_token, gist_visibility, gist_description, verbose, json_output
+        )
     )
 
 
@@ -156,12 +244,15 @@ def archive(
 def restore(
     ctx: typer.Context,
     archive: str = typer.Argument(..., help='Archive path or Gist URL (gist://<gist-id> or file path)'),
-    project: Path | None = typer.Option(None, '--project', '-p', help='Target project directory (default: current)'),
+    project: Path | None = typer.Option(
+        None, '--project', '-p', help='Target project directory (default: current)', callback=_resolve_project
+    ),
     no_translate: bool = typer.Option(False, '--no-translate', help="Don't translate file paths"),
     in_place: bool = typer.Option(False, '--in-place', help='Restore with original session ID (verbatim restore)'),
     launch: bool = typer.Option(False, '--launch', '-l', help='Launch Claude Code after restore'),
     gist_token: str | None = typer.Option(None, '--gist-token', help='GitHub token for private gists'),
     verbose: bool = typer.Option(False, '--verbose', '-v', help='Verbose output'),
+    json_output: bool = typer.Option(False, '--json', help='Emit progress and the result as JSON lines'),
 ) -> None:
     """Restore a Claude Code session from local file or GitHub Gist.
 
@@ -172,7 +263,9 @@ def restore(
 
         claude-session restore ARCHIVE --launch -- --chrome
     """
-    asyncio.run(_restore_async(archive, project, not no_translate, in_place, launch, gist_token, verbose, ctx.args))
+    _run(
+        _restore_async(archive, project, not no_translate, in_place, launch, gist_token, verbose, json_output, ctx.args)
+    )
 
 
 async def _archive_async(
@@ -183,55 +276,57 @@ async def _archive_async(
     gist_visibility: Literal['public', 'secret'],
     gist_description: str,
     verbose: bool,
+    json_output: bool,
 ) -> None:
     """Async implementation of archive command."""
-    logger = CLILogger(verbose=verbose)
+    from src.schemas.operations.gist import GistArchiveResult
+    from src.services.archive import SessionArchiveService
+    from src.services.discovery import SessionDiscoveryService
+    from src.services.parser import SessionParserService
+    from src.storage.gist import GistStorage
+    from src.storage.local import LocalFileSystemStorage
+
+    logger = CLILogger(verbose=verbose, json_lines=json_output)
 
     try:
         # Find the session
         discovery = SessionDiscoveryService()
+        sessions_dir = discovery.claude_sessions_dir
         session_info = await discovery.find_session_by_id(session_id)
 
         if not session_info:
-            typer.secho(f'Error: Session not found: {session_id}', fg=typer.colors.RED, err=True)
-            typer.echo(f'Searched in: {discovery.claude_sessions_dir}', err=True)
+            _report_error(logger, f'Session not found: {session_id}', f'Searched in: {sessions_dir}')
             raise typer.Exit(1)
 
-        await logger.info(f'Found session in folder: {session_info.session_folder}')
+        logger.info_sync(f'Found session in folder: {session_info.session_folder}')
 
         # Parse output parameter - check if it's a Gist URL
-        use_gist = output.startswith('gist://')
+        use_gist = output.startswith(_GIST_PREFIX)
         gist_id = None
 
         if use_gist:
             # Extract gist ID if provided: gist://abc123 or just gist://
-            gist_id = output[7:] if len(output) > 7 else None
+            gist_id = output.removeprefix(_GIST_PREFIX) or None
 
             # Get token from CLI flag, environment, or gh CLI
             token = _get_github_token_cli(gist_token)
             if not token:
-                typer.secho('Error: GitHub token required for Gist storage.', fg=typer.colors.RED, err=True)
-                typer.echo('Provide via one of:')
-                typer.echo('  1. gh auth login (GitHub CLI - recommended)')
-                typer.echo('  2. Set GITHUB_TOKEN environment variable')
-                typer.echo('  3. Pass --gist-token flag')
-                typer.echo()
-                typer.echo('To create a token manually:')
-                typer.echo('  1. Go to https://github.com/settings/tokens')
-                typer.echo('  2. Generate new token (classic)')
-                typer.echo("  3. Select 'gist' scope")
-                typer.echo('  4. Copy the token')
+                _report_error(logger, 'GitHub token required for Gist storage.', _GIST_TOKEN_HELP)
                 raise typer.Exit(1)
 
         # Use the resolved full session ID (supports prefix matching)
         resolved_session_id = session_info.session_id
 
-        # Initialize services
-        with tempfile.TemporaryDirectory(prefix='claude-session-') as temp_dir:
+        # Initialize services. Only Gist uploads stage through a temp dir; local archives
+        # are written straight to their output path, so the service gets no temp_dir
+        # (mkdtemp + explicit rmtree avoids TemporaryDirectory's finalizer)
+        temp_dir = tempfile.mkdtemp(prefix='claude-session-') if use_gist else None
+        output_file = Path(output)
+        try:
             parser_service = SessionParserService()
             archive_service = SessionArchiveService(
                 session_id=resolved_session_id,
-                temp_dir=Path(temp_dir),
+                temp_dir=Path(temp_dir) if temp_dir else None,
                 parser_service=parser_service,
                 session_folder=session_info.session_folder,  # Use folder directly from discovery
             )
@@ -240,7 +335,7 @@ async def _archive_async(
             storage: GistStorage | LocalFileSystemStorage
             if use_gist:
                 # Generate filename for Gist with correct extension
-                timestamp = datetime.now(UTC).strftime('%Y%m%d_%H%M%S')
+                timestamp = time.strftime('%Y%m%d_%H%M%S', time.gmtime())
                 ext = '.json.zst' if format == 'zst' else '.json'
                 filename = f'session-{resolved_session_id[:8]}-{timestamp}{ext}'
 
@@ -253,48 +348,74 @@ async def _archive_async(
                     description=gist_description,
                 )
                 output_path = None  # Don't pass to archive service
-                await logger.info(f'Creating Gist archive: {filename}')
+                logger.info_sync(f'Creating Gist archive: {filename}')
             else:
                 # Local filesystem
-                output_file = Path(output)
-                storage = LocalFileSystemStorage(output_file.parent.resolve())
-                output_path = str(output)
-                filename = output_file.name
-                await logger.info(f'Creating archive: {output}')
+                storage = LocalFileSystemStorage(_fast_resolve(output_file.parent))
+                output_path = output
+                logger.info_sync(f'Creating archive: {output}')
 
             # Create archive
             metadata = await archive_service.create_archive(
                 storage=storage, output_path=output_path, format_param=format, logger=logger
             )
 
-            # Print success
-            if use_gist and isinstance(storage, GistStorage):
-                typer.secho('✓ Archive uploaded to GitHub Gist!', fg=typer.colors.GREEN)
-                typer.echo(f'  URL: {metadata.file_path}')
-                typer.echo(f'  Gist ID: {storage.gist_id}')
-                typer.echo(f'  Format: {metadata.format}')
-                typer.echo(f'  Size: {metadata.size_mb} MB')
-                typer.echo(f'  Records: {metadata.session_records:,} session, {metadata.agent_records:,} agent')
-                typer.echo()
-                typer.echo('To restore, use:')
-                typer.secho(f'  claude-session restore gist://{storage.gist_id}', fg=typer.colors.CYAN)
+            # Print success (single write)
+            if json_output and isinstance(storage, GistStorage):
+                # Same shape as the MCP tool's result, so the gist ID needed for restore is included
+                final_gist_id = storage.gist_id or ''
+                gist_result = GistArchiveResult(
+                    gist_url=metadata.file_path,  # GistStorage returns html_url as file_path
+                    gist_id=final_gist_id,
+                    session_id=resolved_session_id,
+                    format=metadata.format,
+                    size_mb=metadata.size_mb,
+                    session_records=metadata.session_records,
+                    agent_records=metadata.agent_records,
+                    file_count=metadata.file_count,
+                    restore_command=f'claude-session restore gist://{final_gist_id}',
+                )
+                lines = [gist_result.model_dump_json()]
+            elif json_output:
+                lines = [metadata.model_dump_json()]
+            elif use_gist and isinstance(storage, GistStorage):
+                lines = [
+                    _color('✓ Archive uploaded to GitHub Gist!', _GREEN),
+                    f'  URL: {metadata.file_path}',
+                    f'  Gist ID: {storage.gist_id}',
+                    f'  Format: {metadata.format}',
+                    f'  Size: {metadata.size_mb} MB',
+                    f'  Records: {metadata.session_records:,} session, {metadata.agent_records:,} agent',
+                    '',
+                    'To restore, use:',
+                    _color(f'  claude-session restore gist://{storage.gist_id}', _CYAN),
+                ]
             else:
-                typer.secho('✓ Archive created successfully!', fg=typer.colors.GREEN)
-                typer.echo(f'  Path: {metadata.file_path}')
-                typer.echo(f'  Format: {metadata.format}')
-                typer.echo(f'  Size: {metadata.size_mb} MB')
-                typer.echo(f'  Records: {metadata.session_records:,} session, {metadata.agent_records:,} agent')
-                typer.echo(f'  Files: {metadata.file_count}')
+                lines = [
+                    _color('✓ Archive created successfully!', _GREEN),
+                    f'  Path: {metadata.file_path}',
+                    f'  Format: {metadata.format}',
+                    f'  Size: {metadata.size_mb} MB',
+                    f'  Records: {metadata.session_records:,} session, {metadata.agent_records:,} agent',
+                    f'  Files: {metadata.file_count}',
+                ]
                 if verbose:
-                    typer.echo('\n  File breakdown:')
-                    for file_meta in metadata.files:
-                        typer.echo(f'    - {file_meta.filename}: {file_meta.record_count} records')
+                    lines.append('\n  File breakdown:')
+                    lines.extend(
+                        f'    - {file_meta.filename}: {file_meta.record_count} records' for file_meta in metadata.files
+                    )
+            typer.echo('\n'.join(lines))
+        finally:
+            if temp_dir:
+                shutil.rmtree(temp_dir, ignore_errors=True)
 
     except (ClaudeSessionError, FileNotFoundError, FileExistsError) as e:
-        typer.secho(f'Error: {e}', fg=typer.colors.RED, err=True)
+        _report_error(logger, str(e))
         raise typer.Exit(1)
+    except typer.Exit:
+        raise  # Already reported
     except Exception as e:
-        await logger.error(f'Failed to create archive: {e}')
+        logger.error_sync(f'Failed to create archive: {e}')
         if verbose:
             traceback.print_exc()
         raise typer.Exit(1)
@@ -308,142 +429,148 @@ async def _restore_async(
     launch: bool,
     gist_token: str | None,
     verbose: bool,
+    json_output: bool,
     extra_args: Sequence[str],
 ) -> None:
     """Async implementation of restore command."""
-    logger = CLILogger(verbose=verbose)
+    import httpx
+
+    from src.services.restore import SessionRestoreService
+    from src.storage.gist import HTTP_TIMEOUT, GistStorage
+
+    logger = CLILogger(verbose=verbose, json_lines=json_output)
 
     try:
         # Check if it's a Gist URL
-        if archive.startswith('gist://'):
-            gist_id = archive[7:]
+        is_gist_source = archive.startswith(_GIST_PREFIX)
+        if is_gist_source:
+            gist_id = archive.removeprefix(_GIST_PREFIX)
 
             if not gist_id:
-                typer.secho('Error: Gist ID required in format gist://<gist-id>', fg=typer.colors.RED, err=True)
+                _report_error(logger, 'Gist ID required in format gist://<gist-id>')
                 raise typer.Exit(1)
 
             # Get token (public gists don't need auth for reading, but use it if provided)
             token = _get_github_token_cli(gist_token) or ''
 
-            await logger.info(f'Downloading from Gist: {gist_id}')
-
-            # Create Gist storage
-            storage = GistStorage(token=token, gist_id=gist_id)
-
-            # Find the archive file in the gist (look for .json or .json.zst)
-            async with httpx.AsyncClient() as client:
-                headers = {'Accept': 'application/vnd.github.v3+json', 'X-GitHub-Api-Version': '2022-11-28'}
-                if token:
-                    headers['Authorization'] = f'Bearer {token}'
+            logger.info_sync(f'Downloading from Gist: {gist_id}')
 
-                response = await client.get(f'https://api.github.com/gists/{gist_id}', headers=headers)
+            # One client for the metadata lookup and the download (reuses the connection)
+            async with httpx.AsyncClient(timeout=HTTP_TIMEOUT) as client:
+                storage = GistStorage(token=token, gist_id=gist_id, client=client)
 
-                if response.status_code == 404:
-                    typer.secho(f'Error: Gist not found: {gist_id}', fg=typer.colors.RED, err=True)
-                    typer.echo('Check the gist ID and ensure it exists.')
+                try:
+                    gist_data = await storage.fetch_metadata()
+                except httpx.HTTPStatusError as e:
+                    if e.response.status_code != 404:
+                        raise
+                    _report_error(logger, f'Gist not found: {gist_id}', 'Check the gist ID and ensure it exists.')
                     raise typer.Exit(1)
 
-                response.raise_for_status()
-                gist_data = response.json()
-
                 # Find archive file (including base64-encoded variants)
                 files = gist_data['files']
-                archive_file = None
-                for filename in files:
-                    # Strip .b64 suffix for format detection
-                    base_name = filename[:-4] if filename.endswith('.b64') else filename
-                    if base_name.endswith('.json') or base_name.endswith('.json.zst'):
-                        archive_file = filename
-                        break
+                archive_file = next((name for name in files if name.endswith(_GIST_ARCHIVE_SUFFIXES)), None)
 
                 if not archive_file:
-                    typer.secho(f'Error: No archive file found in gist {gist_id}', fg=typer.colors.RED, err=True)
-                    typer.echo(f'Available files: {", ".join(files.keys())}')
+                    _report_error(
+                        logger,
+                        f'No archive file found in gist {gist_id}',
+                        f'Available files: {", ".join(files.keys())}',
+                    )
                     raise typer.Exit(1)
 
-            # Download to temp file
-            await logger.info(f'Downloading {archive_file}...')
-            data = await storage.load(archive_file)
-
-            # Use logical filename (without .b64) so restore service detects format correctly
-            logical_filename = archive_file[:-4] if archive_file.endswith('.b64') else archive_file
-            with tempfile.NamedTemporaryFile(suffix=f'-{logical_filename}', delete=False) as temp_file:
-                temp_file.write(data)
-                archive_path = Path(temp_file.name)
-
-            await logger.info(f'Downloaded {len(data):,} bytes')
+                # Stream to temp file. Use logical filename (without .b64) since
+                # download_to already decodes base64.
+                logger.info_sync(f'Downloading {archive_file} ({files[archive_file].get("size", 0):,} bytes)...')
+                logical_filename = archive_file.removesuffix('.b64')
+                with tempfile.NamedTemporaryFile(suffix=f'-{logical_filename}', delete=False) as temp_file:
+                    archive_path = Path(temp_file.name)
+                    try:
+                        size = await storage.download_to(gist_data, archive_file, temp_file)
+                        logger.info_sync(f'Downloaded {size:,} bytes')
+                    except BaseException:
+                        archive_path.unlink(missing_ok=True)
+                        raise
 
         else:
             # Local file
             archive_path = Path(archive)
 
             # Validate archive exists
-            if not archive_path.exists():
-                typer.secho(f'Error: Archive not found: {archive_path}', fg=typer.colors.RED, err=True)
+            if not os.path.exists(archive_path):
+                _report_error(logger, f'Archive not found: {archive_path}')
                 raise typer.Exit(1)
 
-        # Determine project path
-        if project:
-            project_path = project.resolve()
-            if not project_path.exists():
-                typer.secho(f'Error: Project directory does not exist: {project_path}', fg=typer.colors.RED, err=True)
-                raise typer.Exit(1)
-        else:
-            project_path = Path.cwd()
-
-        await logger.info(f'Restoring to project: {project_path}')
-
-        # Initialize restore service
-        restore_service = SessionRestoreService(project_path)
-
-        # Restore the archive
-        await logger.info(f'Loading archive: {archive_path}')
-        if in_place:
-            await logger.info('In-place mode: restoring with original session ID')
-        result = await restore_service.restore_archive(
-            archive_path=str(archive_path),
-            translate_paths=translate_paths,
-            in_place=in_place,
-            logger=logger,
-        )
+        # From here on every exit path (errors, Ctrl-C) removes a downloaded gist temp file
+        try:
+            # Determine project path
+            project_path = project or Path.cwd()  # --project is resolved and validated by its callback
+
+            logger.info_sync(f'Restoring to project: {project_path}')
+
+            # Initialize restore service
+            restore_service = SessionRestoreService(project_path)
+
+            # Restore the archive
+            logger.info_sync(f'Loading archive: {archive_path}')
+            if in_place:
+                logger.info_sync('In-place mode: restoring with original session ID')
+            result = await restore_service.restore_archive(
+                archive_path=str(archive_path),
+                translate_paths=translate_paths,
+                in_place=in_place,
+                logger=logger,
+            )
+        finally:
+            # Clean up temp file if we downloaded from Gist (even if restore failed).
+            # A plain unlink: nothing else is running on the loop to be blocked.
+            if is_gist_source:
+                archive_path.unlink(missing_ok=True)
+
+        # Print success (single write; echo flushes before launch execs)
+        if json_output:
+            typer.echo(result.model_dump_json())
+            if launch:
+                launch_claude_with_session(result.new_session_id, extra_args=extra_args)
+            return
 
-        # Clean up temp file if we downloaded from Gist
-        if archive.startswith('gist://'):
-            archive_path.unlink()
-
-        # Print success
-        typer.secho('✓ Session restored successfully!', fg=typer.colors.GREEN)
-        typer.echo(f'  New session ID: {result.new_session_id}')
-        typer.echo(f'  Original session ID: {result.original_session_id}')
-        typer.echo(f'  Project: {result.project_path}')
-        typer.echo(f'  Mode: {"in-place" if result.was_in_place else "fork"}')
-        typer.echo()
-        typer.echo('  Files restored:')
-        typer.echo(f'    - Session: 1 main + {len(result.agent_files)} agents')
+        lines = [
+            _color('✓ Session restored successfully!', _GREEN),
+            f'  New session ID: {result.new_session_id}',
+            f'  Original session ID: {result.original_session_id}',
+            f'  Project: {result.project_path}',
+            f'  Mode: {"in-place" if result.was_in_place else "fork"}',
+            '',
+            '  Files restored:',
+            f'    - Session: 1 main + {len(result.agent_files)} agents',
+        ]
         if result.plan_files_restored:
-            typer.echo(f'    - Plans: {result.plan_files_restored}')
+            lines.append(f'    - Plans: {result.plan_files_restored}')
         if result.tool_results_restored:
-            typer.echo(f'    - Tool results: {result.tool_results_restored}')
+            lines.append(f'    - Tool results: {result.tool_results_restored}')
         if result.todos_restored:
-            typer.echo(f'    - Todos: {result.todos_restored}')
+            lines.append(f'    - Todos: {result.todos_restored}')
         if result.tasks_restored:
-            typer.echo(f'    - Tasks: {result.tasks_restored}')
-        typer.echo()
-        typer.echo(f'  Records: {result.main_records_restored:,} main + {result.agent_records_restored:,} agent')
-        typer.echo(f'  Paths translated: {result.paths_translated}')
+            lines.append(f'    - Tasks: {result.tasks_restored}')
+        lines.append('')
+        lines.append(f'  Records: {result.main_records_restored:,} main + {result.agent_records_restored:,} agent')
+        lines.append(f'  Paths translated: {result.paths_translated}')
+        lines.append('')
+        if launch:
+            lines.append('Launching Claude Code...')
+        else:
+            lines.append('To continue this session, run:')
+            lines.append(_color(f'  claude --resume {result.new_session_id}', _CYAN))
+        typer.echo('\n'.join(lines))
 
         if launch:
-            typer.echo()
-            typer.echo('Launching Claude Code...')
             launch_claude_with_session(result.new_session_id, extra_args=extra_args)
             # Note: launch_claude_with_session uses execvp, so we never reach here
-        else:
-            typer.echo()
-            typer.echo('To continue this session, run:')
-            typer.secho(f'  claude --resume {result.new_session_id}', fg=typer.colors.CYAN)
 
+    except typer.Exit:
+        raise  # Already reported
     except Exception as e:
-        await logger.error(f'Failed to restore session: {e}')
+        logger.error_sync(f'Failed to restore session: {e}')
         if verbose:
             traceback.print_exc()
         raise typer.Exit(1)
@@ -453,7 +580,9 @@ async def _restore_async(
 def clone(
     ctx: typer.Context,
     session_id: str | None = typer.Argument(None, help='Session ID to clone (auto-detected inside Claude Code)'),
-    project: Path | None = typer.Option(None, '--project', '-p', help='Target project directory (default: current)'),
+    project: Path | None = typer.Option(
+        None, '--project', '-p', help='Target project directory (default: current)', callback=_resolve_project
+    ),
     no_translate: bool = typer.Option(False, '--no-translate', help="Don't translate file paths"),
     launch: bool = typer.Option(False, '--launch', '-l', help='Launch Claude Code after clone'),
     verbose: bool = typer.Option(False, '--verbose', '-v', help='Verbose output'),
@@ -468,7 +597,7 @@ def clone(
         claude-session clone SESSION_ID       # clone specific session
         claude-session clone SESSION_ID -l    # clone and launch
     """
-    detected = auto_detect_session_id()
+    detected = _auto_detect_session_id()
     if launch and detected is not None:
         typer.secho('Error: --launch cannot be used inside Claude Code.', fg=typer.colors.RED, err=True)
         typer.echo('Use claude --resume <session-id> after cloning instead.', err=True)
@@ -478,7 +607,7 @@ def clone(
     if session_id is None:
         session_id = detected
 
-    asyncio.run(_clone_async(_resolve_session_id(session_id), project, not no_translate, launch, verbose, ctx.args))
+    _run(_clone_async(_resolve_session_id(session_id), project, not no_translate, launch, verbose, ctx.args))
 
 
 async def _clone_async(
@@ -490,19 +619,15 @@ async def _clone_async(
     extra_args: Sequence[str],
 ) -> None:
     """Async implementation of clone command."""
+    from src.services.clone import SessionCloneService
+
     logger = CLILogger(verbose=verbose)
 
     try:
         # Determine project path
-        if project:
-            project_path = project.resolve()
-            if not project_path.exists():
-                typer.secho(f'Error: Project directory does not exist: {project_path}', fg=typer.colors.RED, err=True)
-                raise typer.Exit(1)
-        else:
-            project_path = Path.cwd()
+        project_path = project or Path.cwd()  # --project is resolved and validated by its callback
 
-        await logger.info(f'Cloning to project: {project_path}')
+        logger.info_sync(f'Cloning to project: {project_path}')
 
         # Initialize clone service
         clone_service = SessionCloneService(project_path)
@@ -514,39 +639,42 @@ async def _clone_async(
             logger=logger,
         )
 
-        # Print success
-        typer.secho('✓ Session cloned successfully!', fg=typer.colors.GREEN)
-        typer.echo(f'  New session ID: {result.new_session_id}')
-        typer.echo(f'  Original session ID: {result.original_session_id}')
-        typer.echo(f'  Project: {result.project_path}')
-        typer.echo()
-        typer.echo('  Files cloned:')
-        typer.echo(f'    - Session: 1 main + {len(result.agent_files)} agents')
+        # Print success (single write; echo flushes before launch execs)
+        lines = [
+            _color('✓ Session cloned successfully!', _GREEN),
+            f'  New session ID: {result.new_session_id}',
+            f'  Original session ID: {result.original_session_id}',
+            f'  Project: {result.project_path}',
+            '',
+            '  Files cloned:',
+            f'    - Session: 1 main + {len(result.agent_files)} agents',
+        ]
         if result.plan_files_restored:
-            typer.echo(f'    - Plans: {result.plan_files_restored}')
+            lines.append(f'    - Plans: {result.plan_files_restored}')
         if result.tool_results_restored:
-            typer.echo(f'    - Tool results: {result.tool_results_restored}')
+            lines.append(f'    - Tool results: {result.tool_results_restored}')
         if result.todos_restored:
-            typer.echo(f'    - Todos: {result.todos_restored}')
-        typer.echo()
-        typer.echo(f'  Records: {result.main_records_restored:,} main + {result.agent_records_restored:,} agent')
-        typer.echo(f'  Paths translated: {result.paths_translated}')
+            lines.append(f'    - Todos: {result.todos_restored}')
+        lines.append('')
+        lines.append(f'  Records: {result.main_records_restored:,} main + {result.agent_records_restored:,} agent')
+        lines.append(f'  Paths translated: {result.paths_translated}')
+        lines.append('')
+        if launch:
+            lines.append('Launching Claude Code...')
+        else:
+            lines.append('To continue this session, run:')
+            lines.append(_color(f'  claude --resume {result.new_session_id}', _CYAN))
+        typer.echo('\n'.join(lines))
 
         if launch:
-            typer.echo()
-            typer.echo('Launching Claude Code...')
             launch_claude_with_session(result.new_session_id, extra_args=extra_args)
             # Note: launch_claude_with_session uses execvp, so we never reach here
-        else:
-            typer.echo()
-            typer.echo('To continue this session, run:')
-            typer.secho(f'  claude --resume {result.new_session_id}', fg=typer.colors.CYAN)
 
     except (ClaudeSessionError, FileNotFoundError, FileExistsError) as e:
         typer.secho(f'Error: {e}', fg=typer.colors.RED, err=True)
         raise typer.Exit(1)
     except Exception as e:
-        await logger.error(f'Failed to clone session: {e}')
+        logger.error_sync(f'Failed to clone session: {e}')
         if verbose:
             traceback.print_exc()
         raise typer.Exit(1)
@@ -561,7 +689,9 @@ def delete(
     terminate: bool = typer.Option(False, '--terminate', '-t', help='Terminate running Claude process before deletion'),
     no_backup: bool = typer.Option(False, '--no-backup', help="Don't keep a backup file for undo"),
     dry_run: bool = typer.Option(False, '--dry-run', help='Preview what would be deleted'),
-    project: Path | None = typer.Option(None, '--project', '-p', help='Project directory (default: current)'),
+    project: Path | None = typer.Option(
+        None, '--project', '-p', help='Project directory (default: current)', callback=_resolve_project
+    ),
     verbose: bool = typer.Option(False, '--verbose', '-v', help='Verbose output'),
 ) -> None:
     """Delete session artifacts with auto-backup.
@@ -576,7 +706,7 @@ def delete(
     A backup is saved to ~/.claude-session-mcp/deleted/ for undo capability.
     Use 'restore --in-place' on the backup to undo.
     """
-    asyncio.run(_delete_async(_resolve_session_id(session_id), force, terminate, no_backup, dry_run, project, verbose))
+    _run(_delete_async(_resolve_session_id(session_id), force, terminate, no_backup, dry_run, project, verbose))
 
 
 async def _delete_async(
@@ -589,6 +719,9 @@ async def _delete_async(
     verbose: bool,
 ) -> None:
     """Async implementation of delete command."""
+    from src.services.delete import SessionDeleteService
+    from src.services.info import SessionInfoService
+
     logger = CLILogger(verbose=verbose)
 
     try:
@@ -597,7 +730,7 @@ async def _delete_async(
         info_service = SessionInfoService()
         project_filter: Path | None = None
         if project:
-            project_filter = Path.home() / '.claude' / 'projects' / encode_path(project.resolve())
+            project_filter = Path.home() / '.claude' / 'projects' / encode_path(project)
         session_info = await info_service.resolve_session(session_id, project_filter=project_filter)
         full_session_id = session_info.session_id
 
@@ -620,17 +753,13 @@ async def _delete_async(
                 raise typer.Exit(1)
             else:
                 # Running with --terminate: will terminate
-                await logger.info(f'Session is running (PID {running_pid}), will terminate before deletion')
+                logger.info_sync(f'Session is running (PID {running_pid}), will terminate before deletion')
 
         # Initialize delete service
         # When --project is explicit, use it (user intent wins over discovery)
         # Otherwise, use discovered session_folder (handles cross-directory correctly)
         if project:
-            project_path = project.resolve()
-            if not project_path.exists():
-                typer.secho(f'Error: Project directory does not exist: {project_path}', fg=typer.colors.RED, err=True)
-                raise typer.Exit(1)
-            delete_service = SessionDeleteService(project_path=project_path)
+            delete_service = SessionDeleteService(project_path=project)
         else:
             delete_service = SessionDeleteService(session_folder=session_info.session_folder)
 
@@ -651,49 +780,53 @@ async def _delete_async(
             typer.secho(f'Error: {result.error_message}', fg=typer.colors.RED, err=True)
             raise typer.Exit(1)
 
+        # Print report (single write)
         if dry_run:
-            typer.secho('Dry run - would delete:', fg=typer.colors.YELLOW)
-            typer.echo(f'  Session ID: {result.session_id}')
-            typer.echo(f'  Files: {result.files_deleted}')
-            typer.echo(f'  Directories: {len(result.directories_removed)}')
-            typer.echo(f'  Size: {result.size_freed_bytes:,} bytes')
+            lines = [
+                _color('Dry run - would delete:', _YELLOW),
+                f'  Session ID: {result.session_id}',
+                f'  Files: {result.files_deleted}',
+                f'  Directories: {len(result.directories_removed)}',
+                f'  Size: {result.size_freed_bytes:,} bytes',
+            ]
             if verbose:
-                typer.echo('\n  Files to delete:')
-                for path in result.deleted_files:
-                    typer.echo(f'    - {path}')
+                lines.append('\n  Files to delete:')
+                lines.extend(f'    - {path}' for path in result.deleted_files)
                 if result.directories_removed:
-                    typer.echo('\n  Directories to clean up:')
-                    for path in result.directories_removed:
-                        typer.echo(f'    - {path}')
+                    lines.append('\n  Directories to clean up:')
+                    lines.extend(f'    - {path}' for path in result.directories_removed)
         else:
-            typer.secho('✓ Session deleted successfully!', fg=typer.colors.GREEN)
-            typer.echo(f'  Session ID: {result.session_id}')
-            typer.echo()
-            typer.echo('  Files deleted:')
-            typer.echo(f'    - Session: {result.session_files_deleted}')
+            lines = [
+                _color('✓ Session deleted successfully!', _GREEN),
+                f'  Session ID: {result.session_id}',
+                '',
+                '  Files deleted:',
+                f'    - Session: {result.session_files_deleted}',
+            ]
             if result.plan_files_deleted:
-                typer.echo(f'    - Plans: {result.plan_files_deleted}')
+                lines.append(f'    - Plans: {result.plan_files_deleted}')
             if result.tool_results_deleted:
-                typer.echo(f'    - Tool results: {result.tool_results_deleted}')
+                lines.append(f'    - Tool results: {result.tool_results_deleted}')
             if result.todos_deleted:
-                typer.echo(f'    - Todos: {result.todos_deleted}')
+                lines.append(f'    - Todos: {result.todos_deleted}')
             if result.tasks_deleted:
-                typer.echo(f'    - Tasks: {result.tasks_deleted}')
-            typer.echo()
-            typer.echo(f'  Directories removed: {len(result.directories_removed)}')
-            typer.echo(f'  Size freed: {result.size_freed_bytes:,} bytes')
-            typer.echo(f'  Duration: {result.duration_ms:.0f}ms')
+                lines.append(f'    - Tasks: {result.tasks_deleted}')
+            lines.append('')
+            lines.append(f'  Directories removed: {len(result.directories_removed)}')
+            lines.append(f'  Size freed: {result.size_freed_bytes:,} bytes')
+            lines.append(f'  Duration: {result.duration_ms:.0f}ms')
             if result.backup_path:
-                typer.echo(f'  Backup: {result.backup_path}')
-                typer.echo()
-                typer.echo('To undo, run:')
-                typer.secho(f'  claude-session restore --in-place {result.backup_path}', fg=typer.colors.CYAN)
+                lines.append(f'  Backup: {result.backup_path}')
+                lines.append('')
+                lines.append('To undo, run:')
+                lines.append(_color(f'  claude-session restore --in-place {result.backup_path}', _CYAN))
+        typer.echo('\n'.join(lines))
 
     except (ClaudeSessionError, FileNotFoundError, FileExistsError) as e:
         typer.secho(f'Error: {e}', fg=typer.colors.RED, err=True)
         raise typer.Exit(1)
     except Exception as e:
-        await logger.error(f'Failed to delete session: {e}')
+        logger.error_sync(f'Failed to delete session: {e}')
         if verbose:
             traceback.print_exc()
         raise typer.Exit(1)
@@ -705,7 +838,9 @@ def move(
     session_id: str | None = typer.Argument(
         None, help='Session ID (full or prefix). Auto-detected inside Claude Code.'
     ),
-    project: Path | None = typer.Option(None, '--project', '-p', help='Target project directory (default: current)'),
+    project: Path | None = typer.Option(
+        None, '--project', '-p', help='Target project directory (default: current)', callback=_resolve_project
+    ),
     force: bool = typer.Option(False, '--force', '-f', help='Required to move native (UUIDv4) sessions'),
     terminate: bool = typer.Option(False, '--terminate', '-t', help='Terminate running Claude process before move'),
     no_backup: bool = typer.Option(False, '--no-backup', help="Don't keep a backup file for undo"),
@@ -736,7 +871,7 @@ def move(
         claude-session move 019b5232 --launch      # move and resume
         claude-session move a1b2c3d4 --force       # native session
     """
-    detected = auto_detect_session_id()
+    detected = _auto_detect_session_id()
     if launch and detected is not None:
         typer.secho('Error: --launch cannot be used inside Claude Code.', fg=typer.colors.RED, err=True)
         typer.echo('Use claude --resume <session-id> after moving instead.', err=True)
@@ -745,7 +880,7 @@ def move(
     if session_id is None:
         session_id = detected
 
-    asyncio.run(
+    _run(
         _move_async(
             _resolve_session_id(session_id), project, force, terminate, no_backup, dry_run, launch, verbose, ctx.args
         )
@@ -764,6 +899,9 @@ async def _move_async(
     extra_args: Sequence[str],
 ) -> None:
     """Async implementation of move command."""
+    from src.services.info import SessionInfoService
+    from src.services.move import SessionMoveService
+
     logger = CLILogger(verbose=verbose)
 
     try:
@@ -788,16 +926,10 @@ async def _move_async(
                 typer.echo('Use --terminate to kill the process before moving.', err=True)
                 raise typer.Exit(1)
             else:
-                await logger.info(f'Session is running (PID {running_pid}), will terminate before move')
+                logger.info_sync(f'Session is running (PID {running_pid}), will terminate before move')
 
         # Determine target project path
-        if project:
-            project_path = project.resolve()
-            if not project_path.exists():
-                typer.secho(f'Error: Project directory does not exist: {project_path}', fg=typer.colors.RED, err=True)
-                raise typer.Exit(1)
-        else:
-            project_path = Path.cwd()
+        project_path = project or Path.cwd()  # --project is resolved and validated by its callback
 
         # Pass PID to terminate if running and --terminate was specified
         terminate_pid = running_pid if is_running and terminate and not dry_run else None
@@ -813,54 +945,61 @@ async def _move_async(
             log=logger,
         )
 
+        # Print report (single write; echo flushes before launch execs)
         if dry_run:
-            typer.secho('Dry run - would move:', fg=typer.colors.YELLOW)
-            typer.echo(f'  Session ID: {result.session_id}')
-            typer.echo(f'  From: {result.source_project}')
-            typer.echo(f'  To: {result.target_project}')
-            typer.echo(f'  Files: {result.files_moved}')
-            typer.echo(f'  Paths translated: {result.paths_translated}')
+            lines = [
+                _color('Dry run - would move:', _YELLOW),
+                f'  Session ID: {result.session_id}',
+                f'  From: {result.source_project}',
+                f'  To: {result.target_project}',
+                f'  Files: {result.files_moved}',
+                f'  Paths translated: {result.paths_translated}',
+            ]
         else:
-            typer.secho('✓ Session moved successfully!', fg=typer.colors.GREEN)
-            typer.echo(f'  Session ID: {result.session_id}')
-            typer.echo(f'  From: {result.source_project}')
-            typer.echo(f'  To: {result.target_project}')
-            typer.echo()
-            typer.echo(f'  Files written: {result.files_moved}')
-            typer.echo(f'  Files deleted: {result.files_deleted}')
-            typer.echo(f'  Paths translated: {result.paths_translated}')
-            typer.echo(f'  Duration: {result.duration_ms:.0f}ms')
+            lines = [
+                _color('✓ Session moved successfully!', _GREEN),
+                f'  Session ID: {result.session_id}',
+                f'  From: {result.source_project}',
+                f'  To: {result.target_project}',
+                '',
+                f'  Files written: {result.files_moved}',
+                f'  Files deleted: {result.files_deleted}',
+                f'  Paths translated: {result.paths_translated}',
+                f'  Duration: {result.duration_ms:.0f}ms',
+            ]
             if result.backup_path:
-                typer.echo(f'  Backup: {result.backup_path}')
-                typer.echo()
-                typer.echo('To undo, run:')
-                typer.secho(f'  claude-session restore --in-place {result.backup_path}', fg=typer.colors.CYAN)
+                lines.append(f'  Backup: {result.backup_path}')
+                lines.append('')
+                lines.append('To undo, run:')
+                lines.append(_color(f'  claude-session restore --in-place {result.backup_path}', _CYAN))
 
-            for warning in result.warnings:
-                typer.secho(f'  Warning: {warning}', fg=typer.colors.YELLOW)
+            lines.extend(_color(f'  Warning: {warning}', _YELLOW) for warning in result.warnings)
 
+            lines.append('')
             if launch:
-                typer.echo()
-                typer.echo('Launching Claude Code...')
-                launch_claude_with_session(result.session_id, extra_args=extra_args)
-                # Note: launch_claude_with_session uses execvp, so we never reach here
+                lines.append('Launching Claude Code...')
             else:
-                typer.echo()
-                typer.echo('To continue this session, run:')
-                typer.secho(f'  claude --resume {result.session_id}', fg=typer.colors.CYAN)
+                lines.append('To continue this session, run:')
+                lines.append(_color(f'  claude --resume {result.session_id}', _CYAN))
+        typer.echo('\n'.join(lines))
+
+        if launch and not dry_run:
+            launch_claude_with_session(result.session_id, extra_args=extra_args)
+            # Note: launch_claude_with_session uses execvp, so we never reach here
 
     except (ClaudeSessionError, FileNotFoundError, FileExistsError) as e:
         typer.secho(f'Error: {e}', fg=typer.colors.RED, err=True)
         raise typer.Exit(1)
     except Exception as e:
-        await logger.error(f'Failed to move session: {e}')
+        logger.error_sync(f'Failed to move session: {e}')
         if verbose:
             traceback.print_exc()
         raise typer.Exit(1)
 
 
 def _render_lineage_tree(tree: LineageTree) -> None:
-    """Render a LineageTree with proper box-drawing characters."""
+    """Render a LineageTree with proper box-drawing characters (single write)."""
+    lines: list[str] = []
 
     def render_node(node_id: str, prefix: str, is_last: bool, is_root: bool) -> None:
         if is_root:
@@ -873,16 +1012,14 @@ def _render_lineage_tree(tree: LineageTree) -> None:
         node = tree.nodes[node_id]
         title_suffix = f' ({node.custom_title})' if node.custom_title else ''
         line = f'{prefix}{connector}{node_id}{title_suffix}'
-        if node_id == tree.queried_session_id:
-            typer.secho(line, fg=typer.colors.GREEN)
-        else:
-            typer.echo(line)
+        lines.append(_color(line, _GREEN) if node_id == tree.queried_session_id else line)
 
         children = tree.nodes[node_id].children
         for i, child_id in enumerate(children):
             render_node(child_id, child_prefix, is_last=i == len(children) - 1, is_root=False)
 
     render_node(tree.root_session_id, '', is_last=True, is_root=True)
+    typer.echo('\n'.join(lines))
 
 
 @app.command()
@@ -904,45 +1041,52 @@ def lineage(
         claude-session lineage 019b53ff
         claude-session lineage c3bac5a6 --format tree
     """
+    from src.services.lineage import LineageService
+
     session_id = _resolve_session_id(session_id)
     try:
         lineage_service = LineageService()
         tree = lineage_service.get_full_tree(session_id)
 
         if tree is None:
-            typer.secho(f'No lineage found for {session_id}', fg=typer.colors.YELLOW)
-            typer.echo('(This is either a native session or lineage tracking was not enabled)')
+            typer.echo(
+                _color(f'No lineage found for {session_id}', _YELLOW)
+                + '\n(This is either a native session or lineage tracking was not enabled)'
+            )
             return
 
         if format == 'text':
             node = tree.nodes[tree.queried_session_id]
-            typer.echo(f'Session: {node.session_id}')
+            lines = [f'Session: {node.session_id}']
             if node.custom_title:
-                typer.echo(f'Title:   {node.custom_title}')
+                lines.append(f'Title:   {node.custom_title}')
             if node.cloned_at is not None:
                 # Child node — show operation metadata
-                typer.echo(f'Parent:  {node.parent_id}')
-                typer.echo(f'Cloned:  {node.cloned_at}')
-                typer.echo(f'Method:  {node.method}')
-                typer.echo(f'Source:  {node.parent_project_path}')
-                typer.echo(f'Target:  {node.target_project_path}')
-                typer.echo(f'Machine: {node.target_machine_id}')
+                lines += [
+                    f'Parent:  {node.parent_id}',
+                    f'Cloned:  {node.cloned_at}',
+                    f'Method:  {node.method}',
+                    f'Source:  {node.parent_project_path}',
+                    f'Target:  {node.target_project_path}',
+                    f'Machine: {node.target_machine_id}',
+                ]
                 if node.parent_machine_id:
                     if node.is_cross_machine:
-                        typer.secho(f'Source Machine: {node.parent_machine_id} (cross-machine)', fg=typer.colors.YELLOW)
+                        lines.append(_color(f'Source Machine: {node.parent_machine_id} (cross-machine)', _YELLOW))
                     else:
-                        typer.echo(f'Source Machine: {node.parent_machine_id} (same machine)')
+                        lines.append(f'Source Machine: {node.parent_machine_id} (same machine)')
                 if node.archive_path:
-                    typer.echo(f'Archive: {node.archive_path}')
+                    lines.append(f'Archive: {node.archive_path}')
                 if node.paths_translated:
-                    typer.secho('Paths translated: yes', fg=typer.colors.CYAN)
+                    lines.append(_color('Paths translated: yes', _CYAN))
             else:
                 # Root node — no operation metadata
-                typer.secho(f'Root session with {len(node.children)} clone(s)', fg=typer.colors.CYAN)
+                lines.append(_color(f'Root session with {len(node.children)} clone(s)', _CYAN))
                 for child_id in node.children:
                     child_node = tree.nodes[child_id]
                     title_suffix = f' ({child_node.custom_title})' if child_node.custom_title else ''
-                    typer.echo(f'  └─ {child_id}{title_suffix}')
+                    lines.append(f'  └─ {child_id}{title_suffix}')
+            typer.echo('\n'.join(lines))
 
         elif format == 'tree':
             _render_lineage_tree(tree)
@@ -975,7 +1119,7 @@ def info(
         claude-session info 019b53ff
         claude-session info c3bac5a6 --format json
     """
-    asyncio.run(_info_async(_resolve_session_id(session_id), format))
+    _run(_info_async(_resolve_session_id(session_id), format))
 
 
 async def _info_async(
@@ -983,6 +1127,8 @@ async def _info_async(
     format: Literal['text', 'json'],
 ) -> None:
     """Async implementation of info command."""
+    from src.services.info import SessionInfoService
+
     info_service = SessionInfoService()
     try:
         context = await info_service.get_info(session_id)
@@ -994,57 +1140,57 @@ async def _info_async(
         typer.echo(context.model_dump_json(indent=2))
         return
 
-    # Text format
-    typer.echo(f'Session: {context.session_id}')
+    # Text format (built up and written once)
+    lines = [f'Session: {context.session_id}']
     if context.custom_title:
-        typer.echo(f'Title: {context.custom_title}')
-    typer.echo(f'Project: {context.project_path}')
-    typer.echo()
+        lines.append(f'Title: {context.custom_title}')
+    lines += [f'Project: {context.project_path}', '']
 
     # Origin section
-    typer.secho('Origin:', bold=True)
+    lines.append(_color('Origin:', _BOLD))
     source_display: str = context.source
     if context.parent_id:
         source_display += f' (parent: {context.parent_id[:12]}...)'
-    typer.echo(f'  Source: {source_display}')
-    typer.echo(f'  State: {context.state}')
-    typer.echo(f'  Native: {"yes" if context.is_native else "no (cloned/restored)"}')
+    lines += [
+        f'  Source: {source_display}',
+        f'  State: {context.state}',
+        f'  Native: {"yes" if context.is_native else "no (cloned/restored)"}',
+    ]
     if context.has_lineage:
-        typer.secho('  Lineage: tracked', fg=typer.colors.CYAN)
-    typer.echo()
+        lines.append(_color('  Lineage: tracked', _CYAN))
+    lines.append('')
 
     # Temporal section - Authoritative timestamps
-    typer.secho('Timestamps:', bold=True)
+    lines.append(_color('Timestamps:', _BOLD))
     if context.first_message_at:
-        typer.echo(f'  First Message: {context.first_message_at}')
+        lines.append(f'  First Message: {context.first_message_at}')
     if context.process_created_at:
-        typer.echo(f'  Process Created: {context.process_created_at}')
+        lines.append(f'  Process Created: {context.process_created_at}')
     if context.session_ended_at:
         reason_suffix = f' ({context.session_end_reason})' if context.session_end_reason else ''
-        typer.echo(f'  Session Ended: {context.session_ended_at}{reason_suffix}')
+        lines.append(f'  Session Ended: {context.session_ended_at}{reason_suffix}')
     if context.crash_detected_at:
-        typer.secho(f'  Crash Detected: {context.crash_detected_at}', fg=typer.colors.RED)
+        lines.append(_color(f'  Crash Detected: {context.crash_detected_at}', _RED))
     if context.cloned_at:
-        typer.secho(f'  Cloned: {context.cloned_at}', fg=typer.colors.CYAN)
-    typer.echo()
+        lines.append(_color(f'  Cloned: {context.cloned_at}', _CYAN))
+    lines.append('')
 
     # Files section
-    typer.secho('Files:', bold=True)
-    typer.echo(f'  Session: {context.session_file}')
-    typer.echo(f'  Debug: {context.debug_file}')
+    lines += [_color('Files:', _BOLD), f'  Session: {context.session_file}', f'  Debug: {context.debug_file}']
 
     # Environment section (if available)
     if context.machine_id or context.claude_pid or context.claude_version:
-        typer.echo()
-        typer.secho('Environment:', bold=True)
+        lines += ['', _color('Environment:', _BOLD)]
         if context.machine_id:
-            typer.echo(f'  Machine: {context.machine_id}')
+            lines.append(f'  Machine: {context.machine_id}')
         if context.claude_pid:
-            typer.echo(f'  Claude PID: {context.claude_pid}')
+            lines.append(f'  Claude PID: {context.claude_pid}')
         if context.claude_version:
-            typer.echo(f'  Claude Version: {context.claude_version}')
+            lines.append(f'  Claude Version: {context.claude_version}')
         if context.temp_dir:
-            typer.echo(f'  Temp dir: {context.temp_dir}')
+            lines.append(f'  Temp dir: {context.temp_dir}')
+
+    typer.echo('\n'.join(lines))
 
 
 def main() -> None:
@@ -26,6 +26,7 @@ from pathlib import Path
 from typing import Any, Literal
 
 import attrs
+import httpx
 from mcp.server.fastmcp import Context, FastMCP
 
 from src.exceptions import RunningSessionDeletionError, RunningSessionMoveError
@@ -46,7 +47,7 @@ from src.services.lineage import LineageService
 from src.services.move import SessionMoveService
 from src.services.parser import SessionParserService
 from src.services.restore import SessionRestoreService
-from src.storage.gist import GistStorage
+from src.storage.gist import HTTP_TIMEOUT, GistStorage
 from src.storage.local import LocalFileSystemStorage
 
 # ==============================================================================
@@ -68,6 +69,7 @@ class ServerState:
     temp_dir: tempfile.TemporaryDirectory[str]
     parser_service: SessionParserService
     archive_service: SessionArchiveService
+    http_client: httpx.AsyncClient
 
 
 @attrs.define(frozen=True)
@@ -101,6 +103,9 @@ async def lifespan(mcp_server: FastMCP) -> AsyncIterator[None]:
     temp_dir = tempfile.TemporaryDirectory(prefix='claude-session-')
     temp_path = Path(temp_dir.name)
 
+    # Pooled HTTP client for Gist calls (keeps the api.github.com connection warm across tools)
+    http_client = httpx.AsyncClient(timeout=HTTP_TIMEOUT)
+
     try:
         # Initialize services
         parser_service = SessionParserService()
@@ -120,6 +125,7 @@ async def lifespan(mcp_server: FastMCP) -> AsyncIterator[None]:
             temp_dir=temp_dir,
             parser_service=parser_service,
             archive_service=archive_service,
+            http_client=http_client,
         )
 
         # Register tools with closure over state
@@ -132,7 +138,8 @@ async def lifespan(mcp_server: FastMCP) -> AsyncIterator[None]:
         yield  # Setup successful; application active
 
     finally:
-        # Cleanup temp directory
+        # Close pooled connections, then cleanup temp directory
+        await http_client.aclose()
         temp_dir.cleanup()
         print('[MCP Server] Cleaned up temp directory')
 
@@ -756,6 +763,7 @@ def register_tools(state: ServerState) -> None:
             gist_id=gist_id,
             visibility=visibility,
             description=description,
+            client=state.http_client,
         )
 
         archive_service = SessionArchiveService(
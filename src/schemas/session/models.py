@@ -2607,7 +2607,7 @@ SessionRecordAdapter: pydantic.TypeAdapter[SessionRecord] = pydantic.TypeAdapter
 # ==============================================================================
 
 # Per-type TypeAdapters bypass the 17-member left-to-right union scan.
-# When adding a new record type to SessionRecord, also add a branch below.
+# When adding a new record type to SessionRecord, also add it to _ADAPTERS_BY_TYPE below.
 _user_adapter = pydantic.TypeAdapter(UserRecord)
 _assistant_adapter = pydantic.TypeAdapter(AssistantRecord)
 _summary_adapter = pydantic.TypeAdapter(SummaryRecord)
@@ -2623,13 +2623,27 @@ _saved_hook_context_adapter = pydantic.TypeAdapter(SavedHookContextRecord)
 _agent_name_adapter = pydantic.TypeAdapter(AgentNameRecord)
 _last_prompt_adapter = pydantic.TypeAdapter(LastPromptRecord)
 
+# 'type' field value -> adapter ('system' is handled separately for its subtype fallback)
+_ADAPTERS_BY_TYPE: Mapping[str, pydantic.TypeAdapter[Any]] = {
+    'assistant': _assistant_adapter,
+    'queue-operation': _queue_operation_adapter,
+    'user': _user_adapter,
+    'progress': _progress_adapter,
+    'summary': _summary_adapter,
+    'custom-title': _custom_title_adapter,
+    'file-history-snapshot': _file_history_adapter,
+    'pr-link': _pr_link_adapter,
+    'saved_hook_context': _saved_hook_context_adapter,
+    'agent-name': _agent_name_adapter,
+    'last-prompt': _last_prompt_adapter,
+}
+
 
 def validate_session_record(data: dict[str, Any]) -> SessionRecord:
     """Validate a session record dict using type-dispatch for performance.
 
-    Dispatches to per-type TypeAdapters based on the 'type' field, avoiding
-    the full 17-member left-to-right union scan. Branches are ordered by
-    frequency (assistant 33%, queue-operation 27%, user 22%, progress 17%).
+    Dispatches to per-type TypeAdapters based on the 'type' field with a single
+    dict lookup, avoiding the full 17-member left-to-right union scan.
 
     For 'system' records, uses SystemSubtypeRecord (discriminator='subtype')
     first, falling back to generic SystemRecord if subtype is unknown.
@@ -2642,37 +2656,20 @@ def validate_session_record(data: dict[str, Any]) -> SessionRecord:
     """
     record_type = data.get('type')
 
-    if record_type == 'assistant':
-        return _assistant_adapter.validate_python(data)
-    elif record_type == 'queue-operation':
-        return _queue_operation_adapter.validate_python(data)
-    elif record_type == 'user':
-        return _user_adapter.validate_python(data)
-    elif record_type == 'progress':
-        return _progress_adapter.validate_python(data)
-    elif record_type == 'system':
+    if record_type == 'system':
         try:
             return _system_subtype_adapter.validate_python(data)
         except pydantic.ValidationError:
             # Unknown subtype or malformed subtype record -- SystemRecord's extra='forbid'
             # will also reject known-subtype fields, producing equivalent errors to the union scan
             return _system_fallback_adapter.validate_python(data)
-    elif record_type == 'summary':
-        return _summary_adapter.validate_python(data)
-    elif record_type == 'custom-title':
-        return _custom_title_adapter.validate_python(data)
-    elif record_type == 'file-history-snapshot':
-        return _file_history_adapter.validate_python(data)
-    elif record_type == 'pr-link':
-        return _pr_link_adapter.validate_python(data)
-    elif record_type == 'saved_hook_context':
-        return _saved_hook_context_adapter.validate_python(data)
-    elif record_type == 'agent-name':
-        return _agent_name_adapter.validate_python(data)
-    elif record_type == 'last-prompt':
-        return _last_prompt_adapter.validate_python(data)
-    else:
+
+    # isinstance guard: an unhashable 'type' value must reach the union's ValidationError, not a TypeError
+    adapter = _ADAPTERS_BY_TYPE.get(record_type) if isinstance(record_type, str) else None
+    if adapter is None:
         return SessionRecordAdapter.validate_python(data)
+    record: SessionRecord = adapter.validate_python(data)
+    return record
 
 
 # ==============================================================================
@@ -1,15 +1,23 @@
-"""Service layer for session operations."""
+"""Service layer for session operations.
+
+Exports are resolved lazily (PEP 562) so importing one service module, e.g.
+``src.services.lineage`` for the CLI's lineage command, doesn't load them all.
+"""
 
 from __future__ import annotations
 
-from src.exceptions import AmbiguousSessionError
-from src.schemas.operations.discovery import SessionInfo
-from src.schemas.operations.restore import RestoreResult
-from src.services.archive import SessionArchiveService
-from src.services.clone import SessionCloneService
-from src.services.discovery import SessionDiscoveryService
-from src.services.parser import SessionParserService
-from src.services.restore import PathTranslator, SessionRestoreService
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.exceptions import AmbiguousSessionError
+    from src.schemas.operations.discovery import SessionInfo
+    from src.schemas.operations.restore import RestoreResult
+    from src.services.archive import SessionArchiveService
+    from src.services.clone import SessionCloneService
+    from src.services.discovery import SessionDiscoveryService
+    from src.services.parser import SessionParserService
+    from src.services.restore import PathTranslator, SessionRestoreService
 
 __all__ = [
     'SessionArchiveService',
@@ -22,3 +30,26 @@ __all__ = [
     'RestoreResult',
     'AmbiguousSessionError',
 ]
+
+# Export name -> defining module
+_EXPORTS = {
+    'SessionArchiveService': 'src.services.archive',
+    'SessionCloneService': 'src.services.clone',
+    'SessionDiscoveryService': 'src.services.discovery',
+    'SessionInfo': 'src.schemas.operations.discovery',
+    'SessionParserService': 'src.services.parser',
+    'SessionRestoreService': 'src.services.restore',
+    'PathTranslator': 'src.services.restore',
+    'RestoreResult': 'src.schemas.operations.restore',
+    'AmbiguousSessionError': 'src.exceptions',
+}
+
+
+def __getattr__(name: str) -> object:
+    """Import an exported name on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
@@ -153,7 +153,7 @@ class SessionArchiveService:
     def __init__(
         self,
         session_id: str,
-        temp_dir: Path,
+        temp_dir: Path | None,
         parser_service: SessionParserService,
         *,
         project_path: Path | None = None,
@@ -165,7 +165,7 @@ class SessionArchiveService:
 
         Args:
             session_id: Current Claude Code session ID
-            temp_dir: Temporary directory for default output
+            temp_dir: Temporary directory for default output (None if callers always pass output_path)
             parser_service: Session parser service for loading JSONL files
             project_path: Current project directory (used to find session folder via encoding)
             session_folder: Session folder directly (bypasses encoding, use when discovered)
@@ -240,7 +240,7 @@ class SessionArchiveService:
             Archive metadata
 
         Raises:
-            ValueError: If format detection fails or conflicts
+            ValueError: If format detection fails or conflicts, or neither output_path nor temp_dir is set
             FileNotFoundError: If session files not found
         """
         log = logger or NullLogger()
@@ -262,6 +262,8 @@ class SessionArchiveService:
 
             await log.info(f'Output path: {output_file}')
         else:
+            if self.temp_dir is None:
+                raise ValueError('output_path is required when the archive service has no temp_dir')
             # Use temp directory (default) with correct extension for format
             timestamp = datetime.now(UTC).strftime('%Y%m%d_%H%M%S')
             ext = '.json.zst' if format_param == 'zst' else '.json'
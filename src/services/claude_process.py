@@ -8,8 +8,6 @@ import subprocess
 import time
 from pathlib import Path
 
-import pydantic
-
 from src.schemas.claude_workspace import SessionDatabase
 
 
@@ -50,7 +48,6 @@ def resolve_session_id_from_pid(claude_pid: int, *, max_attempts: int) -> str |
         RuntimeError: If multiple active sessions match the same PID.
     """
     sessions_file = Path.home() / '.claude-workspace' / 'sessions.json'
-    adapter = pydantic.TypeAdapter(SessionDatabase)
 
     for attempt in range(max_attempts):
         if not sessions_file.exists():
@@ -59,7 +56,7 @@ def resolve_session_id_from_pid(claude_pid: int, *, max_attempts: int) -> str |
             continue
 
         with sessions_file.open() as f:
-            db = adapter.validate_python(json.load(f))
+            db = SessionDatabase.model_validate(json.load(f))
 
         matching = [s for s in db.sessions if s.state == 'active' and s.metadata.claude_pid == claude_pid]
 
@@ -7,6 +7,7 @@ Provides utilities to discover sessions by ID and list all available sessions.
 from __future__ import annotations
 
 import json
+import re
 import subprocess
 from datetime import UTC, datetime
 from pathlib import Path
@@ -14,6 +15,9 @@ from pathlib import Path
 from src.exceptions import AmbiguousSessionError
 from src.schemas.operations.discovery import SessionInfo
 
+# A complete session ID (UUID) - these name the session file exactly, so no pattern search is needed
+FULL_SESSION_ID = re.compile(r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}')
+
 
 class SessionDiscoveryService:
     """
@@ -50,19 +54,22 @@ class SessionDiscoveryService:
         if not search_dir.exists():
             return None
 
-        # Use rg to find session files matching the ID/prefix
-        # Use wildcard pattern to support prefix matching
-        result = subprocess.run(
-            ['rg', '--files', '--glob', f'{session_id_or_prefix}*.jsonl', str(search_dir)],
-            capture_output=True,
-            text=True,
-        )
-
-        if not result.stdout.strip():
-            return None
-
-        # Parse matches
-        matches = [Path(p) for p in result.stdout.strip().split('\n') if p]
+        if FULL_SESSION_ID.fullmatch(session_id_or_prefix):
+            # Full IDs: one stat per project folder instead of an rg walk
+            filename = f'{session_id_or_prefix}.jsonl'
+            folders = [search_dir] if project_filter else sorted(search_dir.iterdir())
+            matches = [folder / filename for folder in folders if (folder / filename).is_file()]
+        else:
+            # Use rg to find session files matching the ID/prefix
+            # Use wildcard pattern to support prefix matching
+            result = subprocess.run(
+                ['rg', '--files', '--glob', f'{session_id_or_prefix}*.jsonl', str(search_dir)],
+                capture_output=True,
+                text=True,
+            )
+
+            # Parse matches
+            matches = [Path(p) for p in result.stdout.strip().split('\n') if p]
 
         # Filter out agent files (we only want main session files)
         session_files = [m for m in matches if not m.name.startswith('agent-')]
@@ -71,7 +78,7 @@ class SessionDiscoveryService:
             return None
 
         if len(session_files) > 1:
-            # Ambiguous prefix - multiple sessions match
+            # Ambiguous - prefix (or a duplicated full ID) matches multiple sessions
             match_details = []
             for f in session_files:
                 stat = f.stat()
@@ -16,7 +16,6 @@ from datetime import UTC, datetime
 from pathlib import Path
 
 import psutil
-import pydantic
 
 from src.schemas.claude_workspace import Session, SessionDatabase
 from src.schemas.operations.context import SessionContext
@@ -321,11 +320,9 @@ class SessionInfoService:
         if not CLAUDE_WORKSPACE_SESSIONS.exists():
             return None
 
+        # Validate via the model directly - a per-call TypeAdapter rebuilds the schema wrapper
         with CLAUDE_WORKSPACE_SESSIONS.open() as f:
-            data = json.load(f)
-
-        adapter = pydantic.TypeAdapter(SessionDatabase)
-        db = adapter.validate_python(data)
+            db = SessionDatabase.model_validate(json.load(f))
 
         for session in db.sessions:
             if session.session_id == session_id:
@@ -6,10 +6,11 @@ Framework-agnostic service for loading and validating Claude Code session files.
 
 from __future__ import annotations
 
-import json
 from collections.abc import Sequence
 from pathlib import Path
 
+import orjson
+
 from src.protocols import LoggerProtocol, NullLogger
 from src.schemas.session import SessionRecord
 from src.schemas.session.models import validate_session_record
@@ -65,14 +66,15 @@ class SessionParserService:
         """
         records = []
 
-        with open(file_path, encoding='utf-8') as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if not line:
+        # orjson accepts bytes, so lines go to it undecoded. The gain is orjson's parser
+        # (~2x stdlib json); binary reads on their own measured no faster.
+        with open(file_path, 'rb') as f:
+            for line in f:
+                if not line.strip():
                     continue
 
                 # Parse JSON (fail fast on error)
-                raw_data = json.loads(line)
+                raw_data = orjson.loads(line)
 
                 # Validate with type-dispatch (fast path, better error messages)
                 record = validate_session_record(raw_data)
@@ -50,6 +50,10 @@ from src.services.artifacts import (
 )
 from src.services.lineage import LineageService
 
+# Zstandard frame magic number, raw and as it begins once base64-encoded
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+ZSTD_MAGIC_B64 = b'KLUv'
+
 # ==============================================================================
 # Path Translation Service
 # ==============================================================================
@@ -215,10 +219,12 @@ class SessionRestoreService:
             if in_place:
                 await logger.info('In-place mode: restoring to original paths with original IDs')
 
-        # Detect format and load (strip .b64 suffix for format detection)
-        logical_path = archive_path[:-4] if archive_path.endswith('.b64') else archive_path
+        # Detect format from the leading bytes (zstd magic), so any filename works;
+        # .b64 still marks a base64-wrapped gist download
         is_base64 = archive_path.endswith('.b64')
-        if logical_path.endswith('.zst'):
+        with open(archive_file, 'rb') as f:
+            head = f.read(len(ZSTD_MAGIC))
+        if head.startswith(ZSTD_MAGIC_B64 if is_base64 else ZSTD_MAGIC):
             archive = await self._load_zst_archive(archive_file, is_base64, logger)
         else:
             archive = await self._load_json_archive(archive_file, is_base64, logger)
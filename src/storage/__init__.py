@@ -1,9 +1,34 @@
-"""Storage backends for session archives."""
+"""Storage backends for session archives.
+
+Exports are resolved lazily (PEP 562) so local-only callers don't import httpx
+through the Gist backend.
+"""
 
 from __future__ import annotations
 
-from src.storage.gist import GistStorage
-from src.storage.local import LocalFileSystemStorage
-from src.storage.protocol import StorageBackend
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.storage.gist import GistStorage
+    from src.storage.local import LocalFileSystemStorage
+    from src.storage.protocol import StorageBackend
 
 __all__ = ['GistStorage', 'LocalFileSystemStorage', 'StorageBackend']
+
+# Export name -> defining module
+_EXPORTS = {
+    'GistStorage': 'src.storage.gist',
+    'LocalFileSystemStorage': 'src.storage.local',
+    'StorageBackend': 'src.storage.protocol',
+}
+
+
+def __getattr__(name: str) -> object:
+    """Import an exported name on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
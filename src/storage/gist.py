@@ -11,9 +11,38 @@ from __future__ import annotations
 
 import base64
 import binascii
-from typing import Literal
+import contextlib
+import os
+import time
+from collections.abc import AsyncIterator, Mapping
+from pathlib import Path
+from types import MappingProxyType
+from typing import IO, Any, Literal
 
 import httpx
+import orjson
+
+# GitHub REST API endpoint and the headers every request sends
+GITHUB_API_URL = 'https://api.github.com'
+GITHUB_HEADERS: Mapping[str, str] = MappingProxyType(
+    {'Accept': 'application/vnd.github.v3+json', 'X-GitHub-Api-Version': '2022-11-28'}
+)
+
+# Timeout (seconds) for every GitHub request, whether the client is shared or per-call
+HTTP_TIMEOUT = 30.0
+
+# Read size for streaming raw_url downloads (a multiple of 4 keeps base64 groups aligned)
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Attempts per raw_url download (later attempts resume with a Range request)
+DOWNLOAD_ATTEMPTS = 3
+
+# Cached gist metadata (holds raw_urls, which grant access to secret gists) is
+# private to the user and pruned once older than this
+GIST_CACHE_MAX_AGE_SECONDS = 30 * 24 * 60 * 60
+
+# ASCII whitespace allowed (and ignored) inside base64 file bodies
+_B64_WHITESPACE = b' \t\n\r\v\f'
 
 
 class GistStorage:
@@ -34,6 +63,8 @@ class GistStorage:
         gist_id: str | None = None,
         visibility: Literal['public', 'secret'] = 'secret',
         description: str = 'Claude Code Session Archive',
+        client: httpx.AsyncClient | None = None,
+        cache_dir: Path | None = None,
     ) -> None:
         """
         Initialize Gist storage backend.
@@ -43,6 +74,10 @@ class GistStorage:
             gist_id: Optional existing gist ID (if None, creates new gist on save)
             visibility: 'public' or 'secret' (default: secret)
             description: Gist description
+            client: Optional shared HTTP client (reused across calls, not closed here).
+                If None, each call opens and closes its own client.
+            cache_dir: Directory for ETag-cached gist metadata
+                (default: ~/.claude-session-mcp/cache/gists)
 
         Raises:
             ValueError: If token is empty and trying to save (checked at save time)
@@ -51,7 +86,18 @@ class GistStorage:
         self.gist_id = gist_id
         self.visibility = visibility
         self.description = description
-        self.base_url = 'https://api.github.com'
+        self.base_url = GITHUB_API_URL
+        self._client = client
+        self.cache_dir = cache_dir or (Path.home() / '.claude-session-mcp' / 'cache' / 'gists')
+
+    @contextlib.asynccontextmanager
+    async def _http(self) -> AsyncIterator[httpx.AsyncClient]:
+        """Yield the shared client if one was provided, else a per-call client."""
+        if self._client is not None:
+            yield self._client
+        else:
+            async with httpx.AsyncClient(timeout=HTTP_TIMEOUT) as client:
+                yield client
 
     async def save(self, filename: str, data: bytes) -> str:
         """
@@ -97,14 +143,10 @@ class GistStorage:
 
     async def _create_gist(self, filename: str, content: str) -> str:
         """Create new gist."""
-        async with httpx.AsyncClient() as client:
+        async with self._http() as client:
             response = await client.post(
                 f'{self.base_url}/gists',
-                headers={
-                    'Authorization': f'Bearer {self.token}',
-                    'Accept': 'application/vnd.github.v3+json',
-                    'X-GitHub-Api-Version': '2022-11-28',
-                },
+                headers={**GITHUB_HEADERS, 'Authorization': f'Bearer {self.token}'},
                 json={
                     'description': self.description,
                     'public': self.visibility == 'public',
@@ -113,26 +155,22 @@ class GistStorage:
             )
             response.raise_for_status()
 
-            gist_data = response.json()
+            gist_data = orjson.loads(response.content)
             self.gist_id = gist_data['id']  # Store for future updates
             html_url: str = gist_data['html_url']
             return html_url  # Return web URL
 
     async def _update_gist(self, filename: str, content: str) -> str:
         """Update existing gist."""
-        async with httpx.AsyncClient() as client:
+        async with self._http() as client:
             response = await client.patch(
                 f'{self.base_url}/gists/{self.gist_id}',
-                headers={
-                    'Authorization': f'Bearer {self.token}',
-                    'Accept': 'application/vnd.github.v3+json',
-                    'X-GitHub-Api-Version': '2022-11-28',
-                },
+                headers={**GITHUB_HEADERS, 'Authorization': f'Bearer {self.token}'},
                 json={'files': {filename: {'content': content}}},
             )
             response.raise_for_status()
 
-            gist_data = response.json()
+            gist_data = orjson.loads(response.content)
             html_url: str = gist_data['html_url']
             return html_url
 
@@ -150,20 +188,17 @@ class GistStorage:
             return False
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._http() as client:
                 response = await client.get(
                     f'{self.base_url}/gists/{self.gist_id}',
-                    headers={
-                        'Accept': 'application/vnd.github.v3+json',
-                        'X-GitHub-Api-Version': '2022-11-28',
-                    },
+                    headers=GITHUB_HEADERS,
                 )
 
                 if response.status_code == 404:
                     return False
 
                 response.raise_for_status()
-                gist_data = response.json()
+                gist_data = orjson.loads(response.content)
                 files = gist_data.get('files', {})
                 # Check both the exact filename and the .b64 variant (binary files get .b64 suffix on save)
                 return filename in files or (filename + '.b64') in files
@@ -187,42 +222,200 @@ class GistStorage:
         if not self.gist_id:
             raise ValueError('Cannot load from gist: no gist_id provided')
 
-        async with httpx.AsyncClient() as client:
+        async with self._http() as client:
             response = await client.get(
                 f'{self.base_url}/gists/{self.gist_id}',
-                headers={
-                    'Accept': 'application/vnd.github.v3+json',
-                    'X-GitHub-Api-Version': '2022-11-28',
-                },
+                headers=GITHUB_HEADERS,
             )
             response.raise_for_status()
 
-            gist_data = response.json()
-            files = gist_data.get('files', {})
-
-            if filename not in files:
-                raise ValueError(f"File '{filename}' not found in gist {self.gist_id}")
-
-            # Get file content (must fetch from raw_url for truncated files)
-            file_data = files[filename]
-            if file_data.get('truncated', False) or 'content' not in file_data:
-                # Truncated or missing content - fetch full content from raw_url
-                raw_url = file_data.get('raw_url')
-                if not raw_url:
-                    raise ValueError(
-                        f"File '{filename}' is truncated but no raw_url available. "
-                        f'File size: {file_data.get("size", "unknown")} bytes'
-                    )
-                raw_response = await client.get(raw_url)
-                raw_response.raise_for_status()
-                content = raw_response.text
-            else:
-                content = file_data['content']
-
-            # Decode base64 if the file was binary-encoded on save
-            if filename.endswith('.b64'):
+            return await self._read_file(client, orjson.loads(response.content), filename)
+
+    async def fetch_metadata(self) -> dict[str, Any]:
+        """
+        Fetch gist metadata (GET /gists/{id}), revalidating a cached copy by ETag.
+
+        A repeat fetch of an unchanged gist gets a 304 and reuses the cached copy.
+        The cache keeps the ETag and file list but never inline file content (a
+        restored secret gist must not leave a plaintext session on disk), so files
+        from a cached copy are fetched through raw_url by download_to.
+
+        Returns:
+            Parsed GET /gists/{id} response
+
+        Raises:
+            ValueError: If gist_id not set
+            httpx.HTTPStatusError: If GitHub API call fails (including 404)
+        """
+        if not self.gist_id:
+            raise ValueError('Cannot load from gist: no gist_id provided')
+
+        headers = dict(GITHUB_HEADERS)
+        if self.token:
+            headers['Authorization'] = f'Bearer {self.token}'
+
+        # Never build cache paths from unexpected input
+        cache_path = self.cache_dir / f'{self.gist_id}.json' if self.gist_id.isalnum() else None
+        cached = _read_cache(cache_path) if cache_path else None
+        if cached:
+            headers['If-None-Match'] = cached['etag']
+
+        async with self._http() as client:
+            response = await client.get(f'{self.base_url}/gists/{self.gist_id}', headers=headers)
+
+        if cached and response.status_code == 304:
+            gist_data: dict[str, Any] = cached['gist']
+            return gist_data
+
+        response.raise_for_status()
+        gist_data = orjson.loads(response.content)
+        etag = response.headers.get('ETag')
+        if cache_path and etag:
+            _write_cache(cache_path, etag, gist_data)
+        return gist_data
+
+    async def download_to(self, gist_data: dict[str, Any], filename: str, out: IO[bytes]) -> int:
+        """
+        Stream an archive into a file using already-fetched gist metadata.
+
+        Skips the metadata round-trip when the caller has the GET /gists/{id}
+        response in hand, and writes truncated files chunk-by-chunk from
+        raw_url so peak memory stays at one chunk rather than the archive size.
+        Base64-encoded (.b64) files are decoded incrementally. A transfer cut
+        off by a network error is resumed with an HTTP Range request.
+
+        Args:
+            gist_data: Parsed GET /gists/{id} response
+            filename: Archive filename to load
+            out: Binary file object to write decoded archive bytes into
+
+        Returns:
+            Number of bytes written
+
+        Raises:
+            ValueError: If file not found or base64 content is malformed
+            httpx.HTTPStatusError: If fetching raw content fails
+            httpx.TransportError: If the download keeps failing after retries
+        """
+        file_data = self._file_entry(gist_data, filename)
+        if not (file_data.get('truncated', False) or 'content' not in file_data):
+            # Content is inline in the metadata - nothing to stream
+            data = _decode(filename, file_data['content'])
+            out.write(data)
+            return len(data)
+
+        is_b64 = filename.endswith('.b64')
+        written = 0
+        received = 0  # Raw body bytes consumed (before whitespace removal/decode) - the resume offset
+        pending = b''  # Base64 chars of an unfinished group; kept across retries, as a resume picks up after them
+        async with self._http() as client:
+            for attempt in range(DOWNLOAD_ATTEMPTS):
+                # Identity encoding: a Range offset counts bytes of the encoded body, so a
+                # gzip-served stream could not be resumed from a count of decompressed bytes
+                headers = {'Accept-Encoding': 'identity'}
+                if received:
+                    # Resume an interrupted transfer where it stopped
+                    headers['Range'] = f'bytes={received}-'
                 try:
-                    return base64.b64decode(content)
-                except binascii.Error as e:
-                    raise ValueError(f"Failed to decode base64 content from '{filename}': {e}") from e
-            return content.encode('utf-8')
+                    async with client.stream('GET', file_data['raw_url'], headers=headers) as response:
+                        response.raise_for_status()
+                        # Server ignored the Range header - discard what we already have
+                        skip = received if response.status_code != 206 else 0
+                        async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+                            if skip:
+                                chunk, skip = chunk[skip:], max(0, skip - len(chunk))
+                                if not chunk:
+                                    continue
+                            received += len(chunk)
+                            if is_b64:
+                                # Decode whole 4-char groups, carry the remainder to the next chunk.
+                                # Whitespace (line wrapping, trailing newline) is dropped first so it
+                                # never offsets the grouping, as b64decode ignores it too.
+                                pending += chunk.translate(None, _B64_WHITESPACE)
+                                cut = len(pending) - len(pending) % 4
+                                chunk, pending = _decode(filename, pending[:cut]), pending[cut:]
+                            out.write(chunk)
+                            written += len(chunk)
+                    break
+                except httpx.TransportError:
+                    if attempt == DOWNLOAD_ATTEMPTS - 1:
+                        raise
+
+        if pending:
+            raise ValueError(f"Failed to decode base64 content from '{filename}': incomplete final group")
+        return written
+
+    def _file_entry(self, gist_data: dict[str, Any], filename: str) -> dict[str, Any]:
+        """Look up a file in gist metadata, validating raw_url is present when content is not."""
+        files = gist_data.get('files', {})
+
+        if filename not in files:
+            raise ValueError(f"File '{filename}' not found in gist {self.gist_id}")
+
+        file_data: dict[str, Any] = files[filename]
+        if (file_data.get('truncated', False) or 'content' not in file_data) and not file_data.get('raw_url'):
+            raise ValueError(
+                f"File '{filename}' is truncated but no raw_url available. "
+                f'File size: {file_data.get("size", "unknown")} bytes'
+            )
+        return file_data
+
+    async def _read_file(self, client: httpx.AsyncClient, gist_data: dict[str, Any], filename: str) -> bytes:
+        """Extract a file's bytes from gist metadata, fetching raw_url if truncated."""
+        file_data = self._file_entry(gist_data, filename)
+
+        # Get file content (must fetch from raw_url for truncated files)
+        if file_data.get('truncated', False) or 'content' not in file_data:
+            raw_response = await client.get(file_data['raw_url'])
+            raw_response.raise_for_status()
+            return _decode(filename, raw_response.text)
+        return _decode(filename, file_data['content'])
+
+
+def _decode(filename: str, content: str | bytes) -> bytes:
+    """Decode base64 if the file was binary-encoded on save, else return UTF-8 bytes."""
+    if filename.endswith('.b64'):
+        try:
+            return base64.b64decode(content)
+        except binascii.Error as e:
+            raise ValueError(f"Failed to decode base64 content from '{filename}': {e}") from e
+    return content.encode('utf-8') if isinstance(content, str) else content
+
+
+def _read_cache(path: Path) -> dict[str, Any] | None:
+    """Load a cached {'etag', 'gist'} entry, treating a missing or corrupt file as absent."""
+    try:
+        entry = orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+    if not isinstance(entry, dict) or not isinstance(entry.get('etag'), str) or not isinstance(entry.get('gist'), dict):
+        return None
+    return entry
+
+
+def _write_cache(path: Path, etag: str, gist_data: dict[str, Any]) -> None:
+    """Atomically cache gist metadata with inline file content stripped, mode 0o600 (best effort).
+
+    Also prunes entries older than GIST_CACHE_MAX_AGE_SECONDS so the cache stays bounded.
+    """
+    files = {name: {k: v for k, v in entry.items() if k != 'content'} for name, entry in gist_data['files'].items()}
+    entry = {'etag': etag, 'gist': {**gist_data, 'files': files}}
+    try:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        _prune_cache(path.parent)
+        tmp_path = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+        with os.fdopen(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'wb') as f:
+            os.fchmod(f.fileno(), 0o600)  # O_CREAT keeps the mode of a leftover temp file
+            f.write(orjson.dumps(entry))
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # Cache is an optimization; never fail the fetch over it
+
+
+def _prune_cache(cache_dir: Path) -> None:
+    """Remove cache files (including leftover temp files) not written within the max age."""
+    cutoff = time.time() - GIST_CACHE_MAX_AGE_SECONDS
+    for cached_file in cache_dir.iterdir():
+        with contextlib.suppress(OSError):
+            if cached_file.stat().st_mtime < cutoff:
+                cached_file.unlink()
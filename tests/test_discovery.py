@@ -0,0 +1,76 @@
+"""
+Tests for full session ID lookup in SessionDiscoveryService.
+
+Full IDs are resolved by probing each project folder directly (no rg), so these
+run against a temporary HOME with a hand-built ~/.claude/projects tree.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from src.exceptions import AmbiguousSessionError
+from src.schemas.operations.discovery import SessionInfo
+from src.services.discovery import SessionDiscoveryService
+
+SESSION_ID = '0f9e8d7c-6b5a-4321-8fed-cba987654321'
+
+
+@pytest.fixture
+def projects_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point HOME at tmp_path and return its (empty) ~/.claude/projects folder."""
+    monkeypatch.setenv('HOME', str(tmp_path))
+    projects = tmp_path / '.claude' / 'projects'
+    projects.mkdir(parents=True)
+    return projects
+
+
+def write_session(projects_dir: Path, folder: str) -> Path:
+    """Create a one-record session file for SESSION_ID under the given project folder."""
+    session_folder = projects_dir / folder
+    session_folder.mkdir(exist_ok=True)
+    session_file = session_folder / f'{SESSION_ID}.jsonl'
+    session_file.write_text(json.dumps({'type': 'user', 'cwd': f'/{folder.strip("-")}'}) + '\n')
+    return session_file
+
+
+def find(session_id: str, project_filter: Path | None = None) -> SessionInfo | None:
+    """Run a synchronous lookup through SessionDiscoveryService."""
+    return asyncio.run(SessionDiscoveryService().find_session_by_id(session_id, project_filter=project_filter))
+
+
+def test_full_id_found(projects_dir: Path) -> None:
+    write_session(projects_dir, '-a')
+    (projects_dir / '-b').mkdir()
+
+    assert find(SESSION_ID) == SessionInfo(session_id=SESSION_ID, session_folder=projects_dir / '-a')
+
+
+def test_full_id_follows_moved_session(projects_dir: Path) -> None:
+    session_file = write_session(projects_dir, '-a')
+    assert find(SESSION_ID) == SessionInfo(session_id=SESSION_ID, session_folder=projects_dir / '-a')
+
+    (projects_dir / '-b').mkdir()
+    session_file.rename(projects_dir / '-b' / session_file.name)
+    assert find(SESSION_ID) == SessionInfo(session_id=SESSION_ID, session_folder=projects_dir / '-b')
+
+    (projects_dir / '-b' / session_file.name).unlink()
+    assert find(SESSION_ID) is None
+
+
+def test_full_id_in_two_projects_is_ambiguous(projects_dir: Path) -> None:
+    write_session(projects_dir, '-a')
+    assert find(SESSION_ID) is not None
+
+    write_session(projects_dir, '-b')
+    with pytest.raises(AmbiguousSessionError) as exc_info:
+        find(SESSION_ID)
+    assert len(exc_info.value.matches) == 2
+
+    # --project narrows the search to one folder, which resolves the ambiguity
+    info = find(SESSION_ID, project_filter=projects_dir / '-b')
+    assert info == SessionInfo(session_id=SESSION_ID, session_folder=projects_dir / '-b')
@@ -0,0 +1,184 @@
+"""
+Tests for GistStorage metadata caching and download_to resume behavior.
+
+For resume, a MockTransport serves a truncated .b64 file from raw_url, cuts the
+first response off mid-stream, and answers the retry with either a 206 (Range
+honored) or a 200 (Range ignored). The decoded output must match exactly.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import io
+import os
+import time
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import httpx
+import orjson
+import pytest
+
+from src.storage.gist import DOWNLOAD_ATTEMPTS, GIST_CACHE_MAX_AGE_SECONDS, STREAM_CHUNK_SIZE, GistStorage
+
+FILENAME = 'session.json.zst.b64'
+RAW_URL = 'https://gist.githubusercontent.com/user/abc/raw/session.json.zst.b64'
+
+# Incompressible payload spanning several stream chunks
+DATA = os.urandom(3 * STREAM_CHUNK_SIZE + 123)
+ENCODED = base64.b64encode(DATA)
+
+# Where the first response is cut. aiter_bytes only hands out whole
+# STREAM_CHUNK_SIZE pieces, so the unconsumed tail before the drop is
+# requested again and the resume offset is the last chunk boundary.
+CUT = 2 * STREAM_CHUNK_SIZE + 4001
+RESUME_AT = CUT - CUT % STREAM_CHUNK_SIZE
+
+GIST_DATA = {'files': {FILENAME: {'truncated': True, 'raw_url': RAW_URL, 'size': len(ENCODED)}}}
+
+
+async def interrupted_body(body: bytes) -> AsyncIterator[bytes]:
+    """Yield body in uneven pieces, then fail like a dropped connection."""
+    for start in range(0, len(body), 5000):
+        yield body[start : start + 5000]
+    raise httpx.ReadError('connection reset')
+
+
+async def full_body(body: bytes) -> AsyncIterator[bytes]:
+    """Yield body in uneven pieces."""
+    for start in range(0, len(body), 7000):
+        yield body[start : start + 7000]
+
+
+def download(handler: httpx.MockTransport) -> tuple[bytes, int]:
+    """Run download_to against the mock transport, returning (output, bytes written)."""
+
+    async def run() -> tuple[bytes, int]:
+        async with httpx.AsyncClient(transport=handler) as client:
+            storage = GistStorage(token='', gist_id='abc', client=client)
+            out = io.BytesIO()
+            written = await storage.download_to(GIST_DATA, FILENAME, out)
+            return out.getvalue(), written
+
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize('honor_range', [True, False], ids=['206-resume', '200-restart'])
+def test_interrupted_b64_download_resumes(honor_range: bool) -> None:
+    requests: list[httpx.Request] = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if len(requests) == 1:
+            return httpx.Response(200, content=interrupted_body(ENCODED[:CUT]))
+        if honor_range:
+            start = int(request.headers['Range'].removeprefix('bytes=').removesuffix('-'))
+            return httpx.Response(206, content=full_body(ENCODED[start:]))
+        return httpx.Response(200, content=full_body(ENCODED))
+
+    output, written = download(httpx.MockTransport(handle))
+
+    assert output == DATA
+    assert written == len(DATA)
+    assert len(requests) == 2
+    assert 'Range' not in requests[0].headers
+    assert requests[1].headers['Range'] == f'bytes={RESUME_AT}-'
+    # Range offsets count raw body bytes, so the body must not be content-encoded
+    assert all(r.headers['Accept-Encoding'] == 'identity' for r in requests)
+
+
+@pytest.mark.parametrize('newline', [b'\n', b'\r\n'], ids=['lf', 'crlf'])
+def test_b64_body_with_line_breaks_decodes(newline: bytes) -> None:
+    # MIME-style 76-char lines plus a trailing newline, as base64.b64decode accepts
+    wrapped = base64.encodebytes(DATA).replace(b'\n', newline)
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=full_body(wrapped))
+
+    output, written = download(httpx.MockTransport(handle))
+
+    assert output == DATA
+    assert written == len(DATA)
+
+
+def test_wrapped_b64_resumes_mid_group() -> None:
+    # Line wrapping puts the chunk boundary inside a base64 group, so the drop leaves
+    # a partial group pending; the Range offset must still count raw body bytes
+    wrapped = base64.encodebytes(DATA)
+    assert len(wrapped[:RESUME_AT].translate(None, b'\n')) % 4
+    requests: list[httpx.Request] = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if len(requests) == 1:
+            return httpx.Response(200, content=interrupted_body(wrapped[:CUT]))
+        start = int(request.headers['Range'].removeprefix('bytes=').removesuffix('-'))
+        return httpx.Response(206, content=full_body(wrapped[start:]))
+
+    output, written = download(httpx.MockTransport(handle))
+
+    assert output == DATA
+    assert written == len(DATA)
+    assert requests[1].headers['Range'] == f'bytes={RESUME_AT}-'
+
+
+def test_download_gives_up_after_attempts() -> None:
+    requests: list[httpx.Request] = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, content=interrupted_body(b''))
+
+    with pytest.raises(httpx.ReadError):
+        download(httpx.MockTransport(handle))
+    assert len(requests) == DOWNLOAD_ATTEMPTS
+
+
+def test_metadata_cache_revalidates_without_content(tmp_path: Path) -> None:
+    gist = {
+        'id': 'abc123',
+        'files': {'session.json': {'content': '{"secret": true}', 'truncated': False, 'raw_url': RAW_URL}},
+    }
+    requests: list[httpx.Request] = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get('If-None-Match') == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, content=orjson.dumps(gist), headers={'ETag': '"v1"'})
+
+    async def fetch() -> dict[str, object]:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handle)) as client:
+            storage = GistStorage(token='', gist_id='abc123', client=client, cache_dir=tmp_path)
+            return await storage.fetch_metadata()
+
+    # First fetch returns inline content; the cache on disk must not contain it
+    assert asyncio.run(fetch()) == gist
+    assert b'secret' not in (tmp_path / 'abc123.json').read_bytes()
+
+    # Revalidation hits 304 and serves the cached copy, which points at raw_url instead
+    cached = asyncio.run(fetch())
+    assert cached['files'] == {'session.json': {'truncated': False, 'raw_url': RAW_URL}}
+    assert 'If-None-Match' not in requests[0].headers
+    assert requests[1].headers['If-None-Match'] == '"v1"'
+
+
+def test_metadata_cache_is_private_and_pruned(tmp_path: Path) -> None:
+    stale = tmp_path / 'old999.json'
+    stale.write_bytes(b'{}')
+    old = time.time() - GIST_CACHE_MAX_AGE_SECONDS - 60
+    os.utime(stale, (old, old))
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=orjson.dumps({'id': 'abc123', 'files': {}}), headers={'ETag': '"v1"'})
+
+    async def fetch() -> None:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handle)) as client:
+            await GistStorage(token='', gist_id='abc123', client=client, cache_dir=tmp_path).fetch_metadata()
+
+    asyncio.run(fetch())
+
+    # Cached raw_urls grant access to secret gists, so the file is owner-only
+    assert (tmp_path / 'abc123.json').stat().st_mode & 0o777 == 0o600
+    assert not stale.exists()